@@ -0,0 +1,133 @@
+"""
+Allocation benchmark for evaluate_strand and TUIStub.render.
+
+Run from the project directory:
+
+    $python3 benchmarks/bench_alloc.py
+
+For each operation, the number of Pos objects created, the peak
+memory traced by tracemalloc during a single call and the mean time
+per call are reported, both for the current code (interned Pos
+objects and flat neighbor tables) and for a reconstruction of the
+previous approach, which allocated a new Pos for every step and every
+rendered cell. Those Pos objects are short-lived (each is freed as
+soon as its letter has been read), so they hardly move the peak; the
+Pos count shows the allocations saved.
+"""
+import contextlib
+import io
+import sys
+import timeit
+import tracemalloc
+from typing import Callable
+
+import click
+
+sys.path.insert(0, "src")
+
+from base import Step
+from strands import Pos, Strand, Board
+from tui import TUIStub
+
+
+def legacy_evaluate(board: Board, strand: Strand) -> str:
+    """
+    Evaluate a strand the way Board.evaluate_strand used to:
+    a fresh Pos per step, a bounds-checked lookup per letter,
+    and repeated string concatenation.
+    """
+    positions = [strand.start]
+    current = strand.start
+    for step in strand.steps:
+        current = Pos(current.r + Pos.DIRECTIONS[step.value][0],
+                      current.c + Pos.DIRECTIONS[step.value][1])
+        positions.append(current)
+    result = ""
+    for pos in positions:
+        result += board.get_letter(pos)
+    return result
+
+
+def peak_bytes(operation: Callable[[], object]) -> int:
+    """
+    Return the peak traced memory, in bytes, during one call.
+    """
+    operation()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak - base
+
+
+def positions_created(operation: Callable[[], object]) -> int:
+    """
+    Return the number of Pos objects created during one call.
+    """
+    created = 0
+    init = Pos.__init__
+
+    def counting_init(self: Pos, r: int, c: int) -> None:
+        nonlocal created
+        created += 1
+        init(self, r, c)
+
+    setattr(Pos, "__init__", counting_init)
+    try:
+        operation()
+    finally:
+        setattr(Pos, "__init__", init)
+    return created
+
+
+def report(label: str, operation: Callable[[], object], number: int) -> None:
+    """
+    Print the Pos objects created, peak memory and mean time
+    of an operation.
+    """
+    seconds = timeit.timeit(operation, number=number) / number
+    print(f"{label:>28}: {positions_created(operation):6d} Pos"
+          f"  peak {peak_bytes(operation):8d} B"
+          f"  {seconds * 1e6:9.1f} us/call")
+
+
+@click.command()
+@click.option('-g', '--game', default='a-good-roast', help="Game in boards/ to render.")
+@click.option('-s', '--size', default=64, help="Side of the synthetic board for evaluate_strand.")
+@click.option('-n', '--number', default=200, help="Calls per timing.")
+def main(game: str, size: int, number: int) -> None:
+    # a long boustrophedon strand over a synthetic size x size board
+    board = Board([["a"] * size for _ in range(size)])
+    steps: list[Step] = []
+    for row in range(size):
+        steps += [Step("e") if row % 2 == 0 else Step("w")] * (size - 1)
+        if row < size - 1:
+            steps.append(Step("s"))
+    strand = Strand(Pos(0, 0), steps)
+    assert board.evaluate_strand(strand) == legacy_evaluate(board, strand)
+
+    print(f"evaluate_strand, {len(steps) + 1} cells")
+    report("interned / neighbor table", lambda: board.evaluate_strand(strand), number)
+    report("Pos per step (previous)", lambda: legacy_evaluate(board, strand), number)
+
+    tui = TUIStub(f"boards/{game}.txt", 3, "stub")
+    sink = io.StringIO()
+
+    def render() -> None:
+        sink.seek(0)
+        sink.truncate()
+        with contextlib.redirect_stdout(sink):
+            tui.render()
+
+    print(f"render, {game}")
+    report("interned cells", render, number)
+    interned = tui.board.pos
+    # the previous render loop built a new Pos for every cell
+    setattr(tui.board, "pos", lambda r, c: Pos(r, c))
+    report("Pos per cell (previous)", render, number)
+    setattr(tui.board, "pos", interned)
+
+if __name__ == "__main__":
+    main()
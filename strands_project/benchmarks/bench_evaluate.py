@@ -0,0 +1,71 @@
+"""
+Batch evaluation benchmark for Board.evaluate_strands.
+
+Run from the project directory:
+
+    $python3 benchmarks/bench_evaluate.py
+
+Spells a batch of random strands on a large synthetic board,
+one strand at a time with evaluate_strand and all at once with
+evaluate_strands.
+"""
+import random
+import string
+import sys
+import timeit
+
+import click
+
+sys.path.insert(0, "src")
+
+from base import Step
+from strands import Board, Pos, Strand
+
+
+def random_strand(length: int, size: int, rng: random.Random) -> Strand:
+    """
+    Return a random walk of length cells that stays on
+    a size x size board (cells may repeat).
+    """
+    r, c = rng.randrange(size), rng.randrange(size)
+    start = Pos(r, c)
+    steps = []
+    while len(steps) + 1 < length:
+        step = rng.choice(list(Step))
+        new = Pos(r, c).take_step(step)
+        if 0 <= new.r < size and 0 <= new.c < size:
+            steps.append(step)
+            r, c = new.r, new.c
+    return Strand(start, steps)
+
+
+@click.command()
+@click.option('-s', '--size', default=100, help="Side of the synthetic board.")
+@click.option('-n', '--count', default=5000, help="Strands per batch.")
+@click.option('-l', '--length', default=8, help="Cells per strand.")
+@click.option('--seed', default=142, help="Random seed.")
+def main(size: int, count: int, length: int, seed: int) -> None:
+    rng = random.Random(seed)
+    board = Board([[rng.choice(string.ascii_lowercase) for _ in range(size)]
+                   for _ in range(size)])
+    batch = [random_strand(length, size, rng) for _ in range(count)]
+    assert board.evaluate_strands(batch) == \
+        [board.evaluate_strand(strand) for strand in batch]
+
+    # fresh copies, so that no cell indices are cached on the strands
+    def copies() -> list[Strand]:
+        return [Strand(strand.start, strand.steps) for strand in batch]
+
+    one_by_one = min(timeit.repeat(
+        "[board.evaluate_strand(s) for s in strands]", setup="strands = copies()",
+        globals=locals(), number=1, repeat=5))
+    batched = min(timeit.repeat(
+        "board.evaluate_strands(strands)", setup="strands = copies()",
+        globals=locals(), number=1, repeat=5))
+    print(f"{count} strands of {length} cells on a {size}x{size} board "
+          f"(NumPy: {board.letter_codes() is not None})")
+    print(f"evaluate_strand:  {one_by_one * 1000:8.2f} ms")
+    print(f"evaluate_strands: {batched * 1000:8.2f} ms")
+
+if __name__ == "__main__":
+    main()
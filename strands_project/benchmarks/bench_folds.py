@@ -0,0 +1,86 @@
+"""
+Fold-detection benchmark for Strand.is_folded and are_folded.
+
+Run from the project directory:
+
+    $python3 benchmarks/bench_folds.py
+
+Random non-cyclic strands of each length are grown on a large
+synthetic board, and the linear-time check is timed against the
+previous pairwise comparison of float midpoints.
+"""
+import random
+import sys
+import timeit
+
+import click
+
+sys.path.insert(0, "src")
+
+from base import Step
+from geometry import STEP_DELTAS
+from strands import Pos, Strand, are_folded
+
+
+def pairwise_is_folded(strand: Strand) -> bool:
+    """
+    The previous O(n^2) check: compare the float midpoints of
+    every pair of connections at least two apart.
+    """
+    positions = strand.positions()
+    mids = [((a.r + b.r) / 2.0, (a.c + b.c) / 2.0)
+            for a, b in zip(positions, positions[1:])]
+    for i, m1 in enumerate(mids):
+        for j in range(i + 2, len(mids)):
+            if m1 == mids[j]:
+                return True
+    return False
+
+
+def random_strand(length: int, size: int, rng: random.Random) -> Strand:
+    """
+    Grow a non-cyclic strand of up to length cells from the
+    middle of a size x size board, stopping early if stuck.
+    """
+    r = c = size // 2
+    visited = {(r, c)}
+    steps: list[Step] = []
+    while len(steps) + 1 < length:
+        options = [step for step, (dr, dc) in STEP_DELTAS.items()
+                   if 0 <= r + dr < size and 0 <= c + dc < size
+                   and (r + dr, c + dc) not in visited]
+        if not options:
+            break
+        step = rng.choice(options)
+        r += STEP_DELTAS[step][0]
+        c += STEP_DELTAS[step][1]
+        visited.add((r, c))
+        steps.append(step)
+    return Strand(Pos(size // 2, size // 2), steps)
+
+
+@click.command()
+@click.option('-s', '--size', default=256, help="Side of the synthetic board.")
+@click.option('-b', '--batch', default=50, help="Strands per length.")
+@click.option('--seed', default=142, help="Random seed.")
+def main(size: int, batch: int, seed: int) -> None:
+    rng = random.Random(seed)
+    print(f"{'length':>6} {'folded':>7} {'linear':>11} {'batch':>11} {'pairwise':>11}")
+    for length in [50, 100, 200, 300, 500]:
+        strands = [random_strand(length, size, rng) for _ in range(batch)]
+        expected = [pairwise_is_folded(strand) for strand in strands]
+        assert [strand.is_folded() for strand in strands] == expected
+        assert are_folded(strands) == expected
+
+        linear = timeit.timeit(
+            lambda: [strand.is_folded() for strand in strands], number=5) / 5
+        batched = timeit.timeit(lambda: are_folded(strands), number=5) / 5
+        pairwise = timeit.timeit(
+            lambda: [pairwise_is_folded(strand) for strand in strands],
+            number=1)
+        print(f"{length:>6} {sum(expected):>4}/{batch:<2} "
+              f"{linear * 1000:8.2f} ms {batched * 1000:8.2f} ms "
+              f"{pairwise * 1000:8.2f} ms")
+
+if __name__ == "__main__":
+    main()
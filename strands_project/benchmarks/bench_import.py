@@ -0,0 +1,55 @@
+"""
+Import-time benchmark for the game logic.
+
+Run from the project directory:
+
+    $python3 benchmarks/bench_import.py
+
+Each sample imports strands in a fresh interpreter, so nothing is
+shared between runs. The time to the first dictionary lookup is
+reported separately, since that is where the word list is now loaded.
+"""
+import statistics
+import subprocess
+import sys
+
+import click
+
+IMPORT_ONLY = """
+import time
+start = time.perf_counter()
+import strands
+print(time.perf_counter() - start)
+"""
+
+FIRST_LOOKUP = """
+import time
+import strands
+start = time.perf_counter()
+strands.DICTIONARY.get()
+print(time.perf_counter() - start)
+"""
+
+
+def sample(code: str) -> float:
+    """
+    Run code in a fresh interpreter with src/ on the path,
+    returning the number of seconds it prints.
+    """
+    result = subprocess.run([sys.executable, "-c", code],
+                            env={"PYTHONPATH": "src"},
+                            capture_output=True, text=True, check=True)
+    return float(result.stdout)
+
+
+@click.command()
+@click.option('-n', '--runs', default=20, help="Number of fresh interpreters.")
+def main(runs: int) -> None:
+    for label, code in [("import strands", IMPORT_ONLY),
+                        ("first dictionary lookup", FIRST_LOOKUP)]:
+        times = sorted(sample(code) * 1000 for _ in range(runs))
+        print(f"{label:>24}: median {statistics.median(times):7.2f} ms"
+              f"  min {times[0]:7.2f} ms  max {times[-1]:7.2f} ms")
+
+if __name__ == "__main__":
+    main()
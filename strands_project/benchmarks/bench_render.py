@@ -0,0 +1,90 @@
+"""
+Frame benchmark for TUIStub.render.
+
+Run from the project directory:
+
+    $python3 benchmarks/bench_render.py
+
+For each art frame, reports the time to build one frame, its size
+in bytes, and the number of writes reaching the terminal per frame:
+once through render (one buffered write) and once drawing each piece
+of the frame (art edge, bar or interior row) straight to the terminal
+stream. The raw column is
+the frame's size before SGR coalescing (see src/ansi.py), and the
+last column is the bytes a differential render (--diff) writes after
+a cursor move.
+"""
+import contextlib
+import io
+import sys
+import timeit
+from typing import Callable
+
+import click
+
+sys.path.insert(0, "src")
+
+from ansi import coalesce_sgr
+from tui import TUIStub, SUPPORTED_FRAMES
+
+
+class CountingSink(io.StringIO):
+    """
+    An in-memory terminal that counts the writes it receives.
+    """
+
+    writes: int
+
+    def __init__(self) -> None:
+        """
+        Constructor
+        """
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return super().write(text)
+
+
+def writes_per_frame(draw: Callable[[CountingSink], object]) -> tuple[int, int]:
+    """
+    Return the writes and bytes that one call of draw
+    sends to a fresh counting terminal.
+    """
+    sink = CountingSink()
+    with contextlib.redirect_stdout(sink):
+        draw(sink)
+    return sink.writes, len(sink.getvalue().encode())
+
+
+@click.command()
+@click.option('-g', '--game', default='a-good-roast', help="Game in boards/ to render.")
+@click.option('-n', '--number', default=200, help="Frames per timing.")
+def main(game: str, number: int) -> None:
+    print(f"{'art':>8} {'build':>12} {'bytes':>7} {'raw':>7} {'writes':>7}"
+          f" {'unbuffered':>11} {'diff':>6}")
+    for art in SUPPORTED_FRAMES:
+        tui = TUIStub(f"boards/{game}.txt", 3, art)
+        # some found strands and an attempt in progress
+        for _, strand in tui.game.answers()[:3]:
+            tui.game.submit_strand(strand)
+        tui.add_attempt(tui.board.pos(0, 0))
+
+        seconds = timeit.timeit(tui.build_frame, number=number) / number
+        writes, _ = writes_per_frame(lambda sink: tui.render())
+        frame = tui.build_frame()
+        raw = len(frame.encode())
+        size = len(coalesce_sgr(frame).encode())
+        unbuffered, _ = writes_per_frame(tui.draw_frame)
+
+        tui.diff_render = True
+        tui.build_diff()
+        tui.curr_pos = tui.board.pos(1, 1)
+        tui.action = 'Moved SE'
+        diff = len(coalesce_sgr(tui.build_diff()).encode())
+        print(f"{art:>8} {seconds * 1e6:9.1f} us {size:>7} {raw:>7} "
+              f"{writes:>7} {unbuffered:>11} {diff:>6}")
+
+if __name__ == "__main__":
+    main()
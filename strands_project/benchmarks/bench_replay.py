@@ -0,0 +1,50 @@
+"""
+Replay benchmark for the TUI's headless driver (TUIStub.run_headless).
+
+Run from the project directory:
+
+    $python3 benchmarks/bench_replay.py
+
+For each art frame, plays the same reproducible random key script
+(moves, space, Enter, h and Escape) through the event loop with no
+terminal, once with full redraws and once with differential render
+(--diff), and reports the per-key latency percentiles and the frames
+and bytes written.
+"""
+import random
+import sys
+
+import click
+
+sys.path.insert(0, "src")
+
+from keyboard import Key
+from tui import TUIStub, SUPPORTED_FRAMES
+
+# every key the game responds to, apart from q
+KEYS: list[Key] = [*"12346789", " ", 13, "h", 27]
+
+
+def random_keys(count: int, seed: int) -> list[Key]:
+    """
+    Return a reproducible random key script of the given length.
+    """
+    rng = random.Random(seed)
+    return [rng.choice(KEYS) for _ in range(count)]
+
+
+@click.command()
+@click.option('-g', '--game', default='a-good-roast', help="Game in boards/ to play.")
+@click.option('-n', '--number', default=500, help="Keys per replay.")
+@click.option('-s', '--seed', default=0, help="Seed for the key script.")
+def main(game: str, number: int, seed: int) -> None:
+    keys = random_keys(number, seed)
+    for art in SUPPORTED_FRAMES:
+        for diff_render in (False, True):
+            tui = TUIStub(f"boards/{game}.txt", 3, art, diff_render)
+            report = tui.run_headless(keys)
+            mode = "diff" if diff_render else "full"
+            print(f"{art:>8} {mode:>4}  {report.summary()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+ANSI output helpers for the TUI (tui.py).
+
+coalesce_sgr rewrites a chunk of terminal output so that SGR ("select
+graphic rendition", ESC [ ... m) sequences are only emitted when the
+style of the next visible text actually differs from the style the
+terminal is already in. A run of cells that each set a color and then
+reset it, such as
+
+    ESC[42mA ESC[0m ESC[42mB ESC[0m
+
+becomes a single styled run, ESC[42mAB ESC[0m, and a switch from one
+color straight to another needs no reset in between.
+
+The style is tracked in three slots, the foreground color, the
+background color and the set of other attributes (bold, underline,
+and so on), so that a change to one slot is emitted on its own.
+"""
+import re
+from functools import lru_cache
+
+RESET = "\033[0m"
+
+# within a line: an SGR sequence (with its parameters), any other
+# escape sequence, or a run of plain text
+TOKEN = re.compile(r"\033\[([0-9;]*)m|\033\[[0-9;?]*[A-Za-z]|[^\033]+|\033")
+
+# (foreground, background, attributes); the colors are the SGR
+# parameters that select them, or None for the terminal default
+Style = tuple[str | None, str | None, frozenset[int]]
+DEFAULT: Style = (None, None, frozenset())
+
+# SGR parameters that turn attributes off, and the attributes they clear
+ATTRIBUTES_OFF: dict[int, tuple[int, ...]] = {
+    21: (1,), 22: (1, 2), 23: (3,), 24: (4,), 25: (5, 6), 27: (7,),
+    28: (8,), 29: (9,),
+}
+
+
+@lru_cache(maxsize=1024)
+def apply_sgr(style: Style, params: str) -> Style:
+    """
+    Return the style that results from applying the parameters
+    of one SGR sequence (e.g. "1;38;5;208") to style.
+    """
+    fg, bg, attrs = style
+    codes = params.split(";") if params else ["0"]
+    i = 0
+    while i < len(codes):
+        code = int(codes[i]) if codes[i] else 0
+        if code in (38, 48):
+            # extended color: 38;5;n or 38;2;r;g;b
+            length = 3 if i + 1 < len(codes) and codes[i + 1] == "5" else 5
+            color = ";".join(codes[i:i + length])
+            if code == 38:
+                fg = color
+            else:
+                bg = color
+            i += length
+            continue
+        if code == 0:
+            fg, bg, attrs = DEFAULT
+        elif 1 <= code <= 9:
+            attrs = attrs | {code}
+        elif code in ATTRIBUTES_OFF:
+            attrs = attrs - set(ATTRIBUTES_OFF[code])
+        elif 30 <= code <= 37 or 90 <= code <= 97:
+            fg = str(code)
+        elif code == 39:
+            fg = None
+        elif 40 <= code <= 47 or 100 <= code <= 107:
+            bg = str(code)
+        elif code == 49:
+            bg = None
+        i += 1
+    return (fg, bg, attrs)
+
+
+@lru_cache(maxsize=1024)
+def transition(current: Style, target: Style) -> str:
+    """
+    Return the shortest SGR sequence taking the terminal from the
+    current style to the target style (empty if they are equal).
+    """
+    if current == target:
+        return ""
+    fg, bg, attrs = target
+    if (current[2] - attrs or (current[0] is not None and fg is None)
+            or (current[1] is not None and bg is None)):
+        # something has to be switched off: reset, then set everything
+        params = ["0"] + [str(attr) for attr in sorted(attrs)]
+        params += [color for color in (fg, bg) if color is not None]
+        return f"\033[{';'.join(params)}m"
+    params = [str(attr) for attr in sorted(attrs - current[2])]
+    if fg != current[0]:
+        params.append(str(fg))
+    if bg != current[1]:
+        params.append(str(bg))
+    return f"\033[{';'.join(params)}m"
+
+
+def coalesce_sgr(text: str) -> str:
+    """
+    Return text with its SGR sequences coalesced: each style
+    change is emitted once, just before the next visible text
+    that needs it. The terminal is assumed to start in the
+    default style, and is returned to it before every newline
+    (so that background colors never spill into the next line)
+    and at the end. Other escape sequences, such as cursor
+    moves, are passed through unchanged.
+
+    Since every line ends in the default style, each line is
+    coalesced on its own (and cached, as frames repeat most of
+    their lines), given the style asked for by the lines before.
+    """
+    out = []
+    wanted = DEFAULT
+    for line in text.split("\n"):
+        coalesced, wanted = coalesce_line(wanted, line)
+        out.append(coalesced)
+    return "\n".join(out)
+
+
+@lru_cache(maxsize=1024)
+def coalesce_line(wanted: Style, line: str) -> tuple[str, Style]:
+    """
+    Coalesce the SGR sequences in a line of text (see coalesce_sgr),
+    starting with the terminal in the default style and the given
+    style wanted for the next visible text. Returns the coalesced
+    line, which leaves the terminal in the default style, and the
+    style wanted after it.
+    """
+    out = []
+    emitted = DEFAULT
+    for match in TOKEN.finditer(line):
+        token = match.group(0)
+        params = match.group(1)
+        if params is not None:
+            wanted = apply_sgr(wanted, params)
+        elif token[0] == "\033":
+            out.append(token)
+        else:
+            out.append(transition(emitted, wanted))
+            emitted = wanted
+            out.append(token)
+    if emitted != DEFAULT:
+        out.append(RESET)
+    return "".join(out), wanted
@@ -1,11 +1,100 @@
 """
 File containing ArtTUIWrappers, ArtTUICat2, Art TUICat4, and ArtTUISpecial
 classes, which extend ArtTUIBase,that draw a given pattern for the TUI display.
+
+The frame drawn by each class is fixed once its frame_width and
+interior_width are known, so the constructors build the edges and
+bars once, as ready-made strings (see ArtTUIText). The TUI splices
+these strings straight into its frame buffer, and the print methods
+just print them.
 """
+from abc import abstractmethod
 from ui import ArtTUIBase, TUIStub
 import click
 
-class ArtTUIWrappers(ArtTUIBase):
+
+class ArtTUIText(ArtTUIBase):
+    """
+    Art TUI component whose parts are available as strings.
+    The print methods print exactly these strings.
+    """
+
+    @abstractmethod
+    def top_edge_text(self) -> str:
+        """
+        Return the lines of the top edge, each ending in a newline.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def bottom_edge_text(self) -> str:
+        """
+        Return the lines of the bottom edge, each ending in a newline.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def left_bar_text(self) -> str:
+        """
+        Return the left bar for the next line of the display
+        (without a newline).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def right_bar_text(self) -> str:
+        """
+        Return the right bar for the current line of the
+        display, ending in a newline.
+        """
+        raise NotImplementedError
+
+    def print_top_edge(self) -> None:
+        """
+        Print the top edge of the overall text display.
+        """
+        print(self.top_edge_text(), end="")
+
+    def print_bottom_edge(self) -> None:
+        """
+        Print the bottom edge of the overall text display.
+        """
+        print(self.bottom_edge_text(), end="")
+
+    def print_left_bar(self) -> None:
+        """
+        Print a single line of the left bar to precede a
+        line of the TUI display. The left bar should not
+        conclude with a newline.
+        """
+        print(self.left_bar_text(), end="")
+
+    def print_right_bar(self) -> None:
+        """
+        Print a single line of the right bar to follow a
+        line of the TUI display. The right bar should
+        conclude with a newline.
+        """
+        print(self.right_bar_text(), end="")
+
+
+def nested_edge_lines(tiles: dict[int, str], frame_width: int,
+                      center_width: list[int]) -> list[str]:
+    """
+    Return the lines of a top edge made of nested rings: line
+    frame starts and ends with one tile of each outer ring, with
+    center_width[frame] tiles of its own ring in between.
+    """
+    lines = []
+    for frame in range(frame_width):
+        outer = "".join(tiles[i] for i in range(frame))
+        outer_reversed = "".join(tiles[i] for i in reversed(range(frame)))
+        lines.append(outer + tiles[frame] * center_width[frame]
+                     + outer_reversed + "\n")
+    return lines
+
+
+class ArtTUIWrappers(ArtTUIText):
     """
     Class that draws a given number of nested "wrappers" around the interior
     of the TUI display.
@@ -14,6 +103,10 @@ class ArtTUIWrappers(ArtTUIBase):
     interior_width: int
     color_dict: dict[int, str]
     reset: str
+    _top_edge: str
+    _bottom_edge: str
+    _left_bar: str
+    _right_bar: str
 
     def __init__(self, frame_width: int, interior_width: int):
         """
@@ -35,75 +128,50 @@ class ArtTUIWrappers(ArtTUIBase):
                             9: "\033[48;5;208m"
                         }
 
+        # each ring is two colored spaces wide, and each edge
+        # line is a ring's color across the whole interior
+        tiles = {frame: color + "  " + self.reset
+                 for frame, color in self.color_dict.items()}
+        lines = []
+        for frame in range(frame_width):
+            center_width = interior_width + (frame_width - frame) * 4
+            center = f"{self.color_dict[frame]}{' ' * center_width}{self.reset}"
+            lines.append("".join(tiles[i] for i in range(frame)) + center
+                         + "".join(tiles[i] for i in reversed(range(frame)))
+                         + "\n")
+        self._top_edge = "".join(lines)
+        self._bottom_edge = "".join(reversed(lines))
+        self._left_bar = "".join(tiles[i] for i in range(frame_width))
+        self._right_bar = "".join(tiles[i]
+                                  for i in reversed(range(frame_width))) + "\n"
 
-    def print_top_edge(self) -> None:
+    def top_edge_text(self) -> str:
         """
-        Print the top edge of the overall text display.
-        Depending on the frame_width, multiple lines
-        may be printed.
+        Return the lines of the top edge. Depending on the
+        frame_width, there may be multiple lines.
         """
-        for frame in range(self.frame_width):
-            line = ""
-            for i in range(frame):
-                color = self.color_dict[i]
-                line += color + "  " + self.reset
-
-            center_width = \
-                (self.interior_width) + ((self.frame_width - frame) * 4)
-            color = self.color_dict[frame]
-            line += f"{color}{" " * center_width}{self.reset}"
-
-            for i in reversed(range(frame)):
-                color = self.color_dict[i]
-                line += color + "  " + self.reset
-            print(line)
-
+        return self._top_edge
 
-    def print_bottom_edge(self) -> None:
+    def bottom_edge_text(self) -> str:
         """
-        Print the bottom edge of the overall text display.
-        Depending on the frame_width, multiple lines
-        may be printed.
+        Return the lines of the bottom edge. Depending on the
+        frame_width, there may be multiple lines.
         """
-        for frame in reversed(range(self.frame_width)):
-            line = ""
-            for i in range(frame):
-                color = self.color_dict[i]
-                line += color + "  " + self.reset
-
-            center_width = \
-                (self.interior_width) + ((self.frame_width - frame) * 4)
-            color = self.color_dict[frame]
-            line += f"{color}{" " * center_width}{self.reset}"
-
-            for i in reversed(range(frame)):
-                color = self.color_dict[i]
-                line += color + "  " + self.reset
-            print(line)
+        return self._bottom_edge
 
-    def print_left_bar(self) -> None:
+    def left_bar_text(self) -> str:
         """
-        Print a single line of the left bar to precede a
-        line of the TUI display. The left bar should not
-        conclude with a newline.
+        Return a single line of the left bar.
         """
-        for frame in range(self.frame_width):
-            color = self.color_dict[frame]
-            print(color + "  " + self.reset, end="")
-
+        return self._left_bar
 
-    def print_right_bar(self) -> None:
+    def right_bar_text(self) -> str:
         """
-        Print a single line of the right bar to follow a
-        line of the TUI display. The right bar should
-        conclude with a newline.
+        Return a single line of the right bar.
         """
-        for frame in reversed(range(self.frame_width)):
-            color = self.color_dict[frame]
-            print(color + "  " + self.reset, end="")
-        print()
+        return self._right_bar
 
-class ArtTUICat2(ArtTUIBase):
+class ArtTUICat2(ArtTUIText):
     """
     Class to draw a TUI window with a chevron pattern.
     """
@@ -113,6 +181,8 @@ class ArtTUICat2(ArtTUIBase):
     reset: str
     total_width: int
     row: int
+    _edge: str
+    _bars: list[str]
 
     def __init__(self, frame_width: int, interior_width: int):
         """
@@ -137,68 +207,61 @@ class ArtTUICat2(ArtTUIBase):
                             9: "\033[38;5;208m"
                             }
 
+        # every edge line is the chevron across the whole width,
+        # in the color of its ring; the bars cycle through the
+        # ring colors, one per line of the display
+        chevron = ("/\\" * self.total_width)[:self.total_width]
+        self._edge = "".join(self.color_dict[frame] + chevron + self.reset
+                             + "\n" for frame in range(frame_width))
+        bar = "/\\" * frame_width
+        self._bars = [self.color_dict[frame] + bar + self.reset
+                      for frame in range(frame_width)]
 
-    def print_top_edge(self) -> None:
+    def top_edge_text(self) -> str:
         """
-        Print the top edge of the overall text display.
+        Return the top edge of the overall text display.
         Depending on the frame_width.
         """
-        for frame in range(self.frame_width):
-            row = ""
-            color = self.color_dict[frame]
-            for col in range(self.total_width):
-                if col % 2 == 0:
-                    row += "/"
-                else:
-                    row += "\\"
-            print(color + row + self.reset)
-
+        return self._edge
 
-    def print_bottom_edge(self) -> None:
+    def bottom_edge_text(self) -> str:
         """
-        Print the bottom edge of the overall text display.
-        Depending on the frame_width, multiple lines
-        may be printed.
+        Return the bottom edge, which is the same as the top edge.
         """
-        self.print_top_edge()
+        return self._edge
 
-
-    def print_left_bar(self) -> None:
+    def left_bar_text(self) -> str:
         """
-        Print a single line of the left bar to precede a
-        line of the TUI display. The left bar should not
-        conclude with a newline. Print pattern.
+        Return the left bar for the current line, in the
+        color of the current row (wrapping around to the
+        first ring color after the last).
         """
-        if self.row < self.frame_width:
-            color = self.color_dict[self.row]
-        else:
+        if self.row >= self.frame_width:
             self.row = 0
-            color = self.color_dict[self.row]
+        return self._bars[self.row]
 
-        row = ""
-        for _ in range(self.frame_width):
-            row += "/\\"   
-        print(color + row + self.reset, end = "")
-
-
-    def print_right_bar(self) -> None:
+    def right_bar_text(self) -> str:
         """
-        Increment row and line.
+        Return the right bar for the current line, which
+        matches the left bar, and move on to the next row.
         """
-        self.print_left_bar()
-        self.row+=1
-        print()
+        text = self.left_bar_text() + "\n"
+        self.row += 1
+        return text
 
 
-class ArtTUICat4(ArtTUIBase):
+class ArtTUIEmoji(ArtTUIText):
     """
-    Class that draws a given number of nested "wrappers" around the interior
-    of the TUI display using emojis that envoke Trees, Graphs, and Strands.
+    Class that draws a given number of nested "wrappers" around the
+    interior of the TUI display, with one emoji per ring.
     """
     frame_width: int
     interior_width: int
-    color_dict: dict[int, str]
-    reset: str
+    emoji_dict: dict[int, str]
+    _top_edge: str
+    _bottom_edge: str
+    _left_bar: str
+    _right_bar: str
 
     def __init__(self, frame_width: int, interior_width: int):
         """
@@ -206,184 +269,96 @@ class ArtTUICat4(ArtTUIBase):
         """
         self.frame_width = frame_width
         self.interior_width = interior_width
-        self.emoji_dict = {
-                            0: "🌲",
-                            1: "📈",
-                            2: "🌴",
-                            3: "📉",
-                            4: "🌳",
-                            5: "📊",
-                            6: "🎄",
-                            7: "🧶",
-                        }
+        self.emoji_dict = self.emojis()
 
+        center_widths = [interior_width + (frame_width - frame * 2) - 3
+                         for frame in range(frame_width)]
+        lines = nested_edge_lines(self.emoji_dict, frame_width, center_widths)
+        self._top_edge = "".join(lines)
+        self._bottom_edge = "".join(reversed(lines))
+        self._left_bar = "".join(self.emoji_dict[frame]
+                                 for frame in range(frame_width))
+        self._right_bar = "".join(self.emoji_dict[frame] for frame
+                                  in reversed(range(frame_width))) + "\n"
 
-    def print_top_edge(self) -> None:
+    @abstractmethod
+    def emojis(self) -> dict[int, str]:
         """
-        Print the top edge of the overall text display.
-        Depending on the frame_width, multiple lines
-        may be printed.
+        Return the emoji for each ring, from the outside in.
         """
-        for frame in range(self.frame_width):
-            line = ""
-            for i in range(frame):
-                emoji = self.emoji_dict[i]
-                line += emoji
-
-            center_width = \
-                (self.interior_width) + ((self.frame_width - frame * 2)) - 3
-            emoji = self.emoji_dict[frame]
-            line += emoji * center_width
-
-            for i in reversed(range(frame)):
-                emoji = self.emoji_dict[i]
-                line += emoji
-            print(line)
+        raise NotImplementedError
 
-
-    def print_bottom_edge(self) -> None:
+    def top_edge_text(self) -> str:
         """
-        Print the bottom edge of the overall text display.
-        Depending on the frame_width, multiple lines
-        may be printed.
+        Return the lines of the top edge. Depending on the
+        frame_width, there may be multiple lines.
         """
-        for frame in reversed(range(self.frame_width)):
-            line = ""
-            for i in range(frame):
-                emoji = self.emoji_dict[i]
-                line += emoji
-
-            center_width = \
-                (self.interior_width) + ((self.frame_width - frame * 2)) - 3
-            emoji = self.emoji_dict[frame]
-            line += emoji * center_width
-
-            for i in reversed(range(frame)):
-                emoji = self.emoji_dict[i]
-                line += emoji
-            print(line)
-
+        return self._top_edge
 
-    def print_left_bar(self) -> None:
+    def bottom_edge_text(self) -> str:
         """
-        Print a single line of the left bar to precede a
-        line of the TUI display. The left bar should not
-        conclude with a newline.
+        Return the lines of the bottom edge. Depending on the
+        frame_width, there may be multiple lines.
         """
-        for frame in range(self.frame_width):
-            emoji = self.emoji_dict[frame]
-            print(emoji, end="")
+        return self._bottom_edge
 
+    def left_bar_text(self) -> str:
+        """
+        Return a single line of the left bar.
+        """
+        return self._left_bar
 
-    def print_right_bar(self) -> None:
+    def right_bar_text(self) -> str:
         """
-        Print a single line of the right bar to follow a
-        line of the TUI display. The right bar should
-        conclude with a newline.
+        Return a single line of the right bar.
         """
-        for frame in reversed(range(self.frame_width)):
-            emoji = self.emoji_dict[frame]
-            print(emoji, end="")
-        print()
+        return self._right_bar
 
 
-class ArtTUISpecial(ArtTUIBase):
+class ArtTUICat4(ArtTUIEmoji):
     """
     Class that draws a given number of nested "wrappers" around the interior
-    of the TUI display using special Emojis.
+    of the TUI display using emojis that envoke Trees, Graphs, and Strands.
     """
-    frame_width: int
-    interior_width: int
-    color_dict: dict[int, str]
-    reset: str
-
-    def __init__(self, frame_width: int, interior_width: int):
-        """
-        Constructor
-        """
-        self.frame_width = frame_width
-        self.interior_width = interior_width
-        self.emoji_dict = {
-                            0: "🥞",
-                            1: "🥯",
-                            2: "🧇",
-                            3: "🥓",
-                            4: "🍳",
-                            5: "🍞",
-                            6: "🥚",
-                            7: "🧈",
-                            8: "🍩",
-                            9: "☕"
-                        }
-
-
-    def print_top_edge(self) -> None:
-        """
-        Print the top edge of the overall text display.
-        Depending on the frame_width, multiple lines
-        may be printed.
-        """
-        for frame in range(self.frame_width):
-            line = ""
-            for i in range(frame):
-                emoji = self.emoji_dict[i]
-                line += emoji
-
-            center_width = \
-                (self.interior_width) + ((self.frame_width - frame * 2)) - 3
-            emoji = self.emoji_dict[frame]
-            line += emoji * center_width
-
-            for i in reversed(range(frame)):
-                emoji = self.emoji_dict[i]
-                line += emoji
-            print(line)
 
-
-    def print_bottom_edge(self) -> None:
+    def emojis(self) -> dict[int, str]:
         """
-        Print the bottom edge of the overall text display.
-        Depending on the frame_width, multiple lines
-        may be printed.
+        Return the emoji for each ring, from the outside in.
         """
-        for frame in reversed(range(self.frame_width)):
-            line = ""
-            for i in range(frame):
-                emoji = self.emoji_dict[i]
-                line += emoji
-
-            center_width = \
-                (self.interior_width) + ((self.frame_width - frame * 2)) - 3
-            emoji = self.emoji_dict[frame]
-            line += emoji * center_width
+        return {
+                0: "🌲",
+                1: "📈",
+                2: "🌴",
+                3: "📉",
+                4: "🌳",
+                5: "📊",
+                6: "🎄",
+                7: "🧶",
+            }
 
-            for i in reversed(range(frame)):
-                emoji = self.emoji_dict[i]
-                line += emoji
-            print(line)
-
-
-    def print_left_bar(self) -> None:
-        """
-        Print a single line of the left bar to precede a
-        line of the TUI display. The left bar should not
-        conclude with a newline.
-        """
-        for frame in range(self.frame_width):
-            emoji = self.emoji_dict[frame]
-            print(emoji, end="")
 
+class ArtTUISpecial(ArtTUIEmoji):
+    """
+    Class that draws a given number of nested "wrappers" around the interior
+    of the TUI display using special Emojis.
+    """
 
-    def print_right_bar(self) -> None:
-        """
-        Print a single line of the right bar to follow a
-        line of the TUI display. The right bar should
-        conclude with a newline.
-        """
-        for frame in reversed(range(self.frame_width)):
-            emoji = self.emoji_dict[frame]
-            print(emoji, end="")
-        print()
+    def emojis(self) -> dict[int, str]:
+        """
+        Return the emoji for each ring, from the outside in.
+        """
+        return {
+                0: "🥞",
+                1: "🥯",
+                2: "🧇",
+                3: "🥓",
+                4: "🍳",
+                5: "🍞",
+                6: "🥚",
+                7: "🧈",
+                8: "🍩",
+                9: "☕"
+            }
 
 
 @click.command()
@@ -0,0 +1,36 @@
+"""
+Build step for the compiled dictionary.
+
+Run from the project directory:
+
+    $python3 src/build_dictionary.py
+
+to (re)compile assets/web2.txt into assets/web2.dict. The game
+also rebuilds the compiled file on its own whenever it is missing
+or stale, so this step is only needed to pay that cost up front.
+"""
+import click
+
+from dictionary import (
+    SOURCE_FILE,
+    COMPILED_FILE,
+    WordList,
+    build_dictionary,
+    is_up_to_date
+                        )
+
+
+@click.command()
+@click.option('-s', '--source', default=SOURCE_FILE, help="Plain-text word list.")
+@click.option('-o', '--output', default=COMPILED_FILE, help="Compiled dictionary file.")
+@click.option('--force', is_flag=True, help="Rebuild even if up to date.")
+def main(source: str, output: str, force: bool) -> None:
+    if force or not is_up_to_date(source, output):
+        build_dictionary(source, output)
+        print(f"Compiled {source} -> {output}")
+    else:
+        print(f"{output} is up to date")
+    print(f"{len(WordList.open(source, output))} words")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,390 @@
+"""
+Compiled, memory-mapped dictionary for the Strands game.
+
+The plain-text dictionary (assets/web2.txt) is compiled once into a
+binary file (assets/web2.dict) that holds, after a fixed-size header
+recording the format version and a digest of the source file:
+
+- a table of uint32 word offsets, one per word plus a sentinel,
+- a table of uint32 first-child indices, one per trie node plus
+  a sentinel,
+- one label byte per trie node,
+- one terminal flag byte per trie node, and
+- a single blob containing every (sorted) word back to back.
+
+Integers are stored in native byte order, since the file is a local
+build artifact. The trie nodes are numbered in breadth-first order,
+so the children of node i are exactly the nodes numbered
+first_child[i] up to (but not including) first_child[i + 1], and
+their labels are sorted. Node 0 is the root (the empty prefix).
+
+WordList maps the compiled file and answers exact lookups, prefix
+queries and prefix iteration by walking the flat trie arrays, in
+time proportional to the length of the word, without creating any
+per-word or per-node Python objects. The compiled file is rebuilt
+automatically whenever the digest of the source file no longer
+matches.
+
+Nothing is read at import time. DICTIONARY is a shared
+DictionaryLoader that opens the word list the first time get() is
+called, and can optionally be warmed in a background thread.
+"""
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from array import array
+from bisect import bisect_left
+from collections import deque
+from typing import Iterator
+
+SOURCE_FILE = "assets/web2.txt"
+COMPILED_FILE = "assets/web2.dict"
+
+# Only words with more than three letters can ever be submitted
+MIN_WORD_LENGTH = 4
+
+MAGIC = b"SWDC"
+FORMAT_VERSION = 2
+
+# magic, version, source digest, word count, node count, blob length
+HEADER = struct.Struct("=4sI32sIII")
+
+ROOT = 0
+NO_NODE = -1
+
+
+######################################################################
+
+
+def source_digest(source: str) -> bytes:
+    """
+    Return the SHA-256 digest of the contents of a source file.
+    """
+    with open(source, "rb") as file:
+        return hashlib.sha256(file.read()).digest()
+
+
+def build_trie(words: list[bytes]) -> tuple[array, bytes, bytes]:
+    """
+    Build the flat trie for a sorted list of distinct words,
+    returning the first-child table, the labels and the
+    terminal flags described above.
+
+    Each node stands for the range of words sharing its
+    prefix. Because the words are sorted, the words below
+    each child form a contiguous sub-range, found by bisection.
+    """
+    first_child = array("I")
+    labels = bytearray([0])
+    terminal = bytearray()
+    # (depth, lo, hi) for each node, in breadth-first order
+    queue: deque[tuple[int, int, int]] = deque([(0, 0, len(words))])
+    num_nodes = 1
+    while queue:
+        depth, lo, hi = queue.popleft()
+        first_child.append(num_nodes)
+        # in sorted order, a word equal to the prefix comes first
+        if lo < hi and len(words[lo]) == depth:
+            terminal.append(1)
+            lo += 1
+        else:
+            terminal.append(0)
+        prefix_end = depth + 1
+        while lo < hi:
+            label = words[lo][depth]
+            group_end = bisect_left(
+                words, words[lo][:depth] + bytes([label + 1]), lo, hi)
+            labels.append(label)
+            queue.append((prefix_end, lo, group_end))
+            num_nodes += 1
+            lo = group_end
+    first_child.append(num_nodes)
+    return first_child, bytes(labels), bytes(terminal)
+
+
+def compile_words(source: str) -> bytes:
+    """
+    Compile a plain-text word list (one word per line) into
+    the binary format described above, returning the bytes.
+    Words shorter than MIN_WORD_LENGTH are dropped, and the
+    remaining words are sorted bytewise and de-duplicated.
+    """
+    with open(source, "rb") as file:
+        data = file.read()
+    words = sorted({line.strip() for line in data.splitlines()
+                    if len(line.strip()) >= MIN_WORD_LENGTH})
+
+    offsets = array("I", [0])
+    total = 0
+    for word in words:
+        total += len(word)
+        offsets.append(total)
+    first_child, labels, terminal = build_trie(words)
+
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, hashlib.sha256(data).digest(),
+                         len(words), len(labels), total)
+    return b"".join([header, offsets.tobytes(), first_child.tobytes(),
+                     labels, terminal, *words])
+
+
+def build_dictionary(source: str = SOURCE_FILE,
+                     target: str = COMPILED_FILE) -> None:
+    """
+    Compile source into target. The file is written to a
+    temporary name first and then moved into place, so
+    concurrent readers never observe a partial file.
+    """
+    compiled = compile_words(source)
+    temp = f"{target}.{os.getpid()}.tmp"
+    with open(temp, "wb") as file:
+        file.write(compiled)
+    os.replace(temp, target)
+
+
+def is_up_to_date(source: str = SOURCE_FILE,
+                  target: str = COMPILED_FILE) -> bool:
+    """
+    Decide whether or not target is a compiled file of the
+    current format whose digest matches the contents of source.
+    """
+    try:
+        with open(target, "rb") as file:
+            header = file.read(HEADER.size)
+    except OSError:
+        return False
+    if len(header) != HEADER.size:
+        return False
+    magic, version, digest, _, _, _ = HEADER.unpack(header)
+    return (magic == MAGIC and version == FORMAT_VERSION
+            and digest == source_digest(source))
+
+
+######################################################################
+
+
+class WordList:
+    """
+    A sorted word list with a flat trie index, backed by a
+    compiled dictionary file (or by the equivalent bytes held
+    in memory).
+
+    Trie nodes are plain integers: ROOT is the empty prefix,
+    child() steps from a node to the node for one more letter,
+    and NO_NODE means that no word has that prefix.
+    """
+
+    _data: mmap.mmap | bytes
+    _offsets: memoryview
+    _first_child: memoryview
+    _labels_start: int
+    _terminal: memoryview
+    _blob: memoryview
+    _count: int
+    _num_nodes: int
+
+    def __init__(self, data: mmap.mmap | bytes):
+        """
+        Constructor
+
+        Raises ValueError if data is not a compiled
+        dictionary of the current format.
+        """
+        if len(data) < HEADER.size:
+            raise ValueError("Compiled dictionary is truncated")
+        magic, version, _, count, num_nodes, blob_len = \
+            HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("Not a compiled dictionary of this format")
+
+        offsets_start = HEADER.size
+        first_child_start = offsets_start + 4 * (count + 1)
+        labels_start = first_child_start + 4 * (num_nodes + 1)
+        terminal_start = labels_start + num_nodes
+        blob_start = terminal_start + num_nodes
+        if len(data) != blob_start + blob_len:
+            raise ValueError("Compiled dictionary has the wrong size")
+
+        self._data = data
+        view = memoryview(data)
+        self._offsets = view[offsets_start:first_child_start].cast("I")
+        self._first_child = view[first_child_start:labels_start].cast("I")
+        self._labels_start = labels_start
+        self._terminal = view[terminal_start:blob_start]
+        self._blob = view[blob_start:]
+        self._count = count
+        self._num_nodes = num_nodes
+
+    @classmethod
+    def open(cls, source: str = SOURCE_FILE,
+             target: str = COMPILED_FILE) -> "WordList":
+        """
+        Map the compiled dictionary at target, (re)building it
+        from source first if it is missing or stale. If target
+        cannot be written, the compiled bytes are kept in memory.
+        """
+        if not is_up_to_date(source, target):
+            try:
+                build_dictionary(source, target)
+            except OSError:
+                return cls(compile_words(source))
+        with open(target, "rb") as file:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(data)
+
+    def __len__(self) -> int:
+        """
+        Return the number of words in the list.
+        """
+        return self._count
+
+    def num_nodes(self) -> int:
+        """
+        Return the number of nodes in the trie.
+        """
+        return self._num_nodes
+
+    def word(self, i: int) -> str:
+        """
+        Return the ith word in sorted order.
+        """
+        if not 0 <= i < self._count:
+            raise IndexError("word index out of range")
+        return bytes(self._blob[self._offsets[i]:self._offsets[i + 1]]) \
+            .decode("ascii")
+
+    def child(self, node: int, letter: str) -> int:
+        """
+        Return the node reached from node by appending a
+        single letter, or NO_NODE if no word continues that way.
+        """
+        if len(letter) != 1 or not letter.isascii():
+            return NO_NODE
+        start = self._labels_start
+        found = self._data.find(letter.encode("ascii"),
+                                start + self._first_child[node],
+                                start + self._first_child[node + 1])
+        return found - start if found >= 0 else NO_NODE
+
+    def is_word_node(self, node: int) -> bool:
+        """
+        Decide whether or not the prefix spelled by node
+        is itself a word.
+        """
+        return self._terminal[node] == 1
+
+    def find_node(self, prefix: str) -> int:
+        """
+        Return the node spelling prefix, or NO_NODE if no
+        word starts with prefix.
+        """
+        if not prefix.isascii():
+            return NO_NODE
+        data = self._data
+        first_child = self._first_child
+        start = self._labels_start
+        node = ROOT
+        for label in prefix.encode("ascii"):
+            found = data.find(bytes((label,)), start + first_child[node],
+                              start + first_child[node + 1])
+            if found < 0:
+                return NO_NODE
+            node = found - start
+        return node
+
+    def __contains__(self, word: object) -> bool:
+        """
+        Decide whether or not word is in the list.
+        """
+        if not isinstance(word, str):
+            return False
+        node = self.find_node(word)
+        return node != NO_NODE and self._terminal[node] == 1
+
+    def has_prefix(self, prefix: str) -> bool:
+        """
+        Decide whether or not any word in the list
+        starts with prefix (including prefix itself).
+        """
+        return self.find_node(prefix) != NO_NODE
+
+    def iter_prefix(self, prefix: str) -> Iterator[str]:
+        """
+        Yield, in sorted order, every word in the list that
+        starts with prefix (including prefix itself).
+        """
+        node = self.find_node(prefix)
+        if node == NO_NODE:
+            return
+        data = self._data
+        first_child = self._first_child
+        start = self._labels_start
+        stack = [(node, prefix)]
+        while stack:
+            node, spelled = stack.pop()
+            if self._terminal[node] == 1:
+                yield spelled
+            # push in reverse so that children pop in label order
+            for child in range(first_child[node + 1] - 1,
+                               first_child[node] - 1, -1):
+                stack.append((child, spelled + chr(data[start + child])))
+
+
+######################################################################
+
+
+class DictionaryLoader:
+    """
+    Thread-safe, load-once access to a WordList. The word list
+    is opened on the first call to get() (or by warm()), and
+    every later call returns the same object.
+    """
+
+    source: str
+    target: str
+    _words: WordList | None
+    _lock: threading.Lock
+
+    def __init__(self, source: str = SOURCE_FILE,
+                 target: str = COMPILED_FILE):
+        """
+        Constructor
+        """
+        self.source = source
+        self.target = target
+        self._words = None
+        self._lock = threading.Lock()
+
+    def get(self) -> WordList:
+        """
+        Return the word list, opening (and if needed,
+        compiling) it on first use.
+        """
+        words = self._words
+        if words is None:
+            with self._lock:
+                if self._words is None:
+                    self._words = WordList.open(self.source, self.target)
+                words = self._words
+        return words
+
+    def is_loaded(self) -> bool:
+        """
+        Decide whether or not the word list has been opened.
+        """
+        return self._words is not None
+
+    def warm(self) -> threading.Thread:
+        """
+        Start opening the word list in a background daemon
+        thread, returning the thread. Calls to get() made
+        while it is running wait for it to finish.
+        """
+        thread = threading.Thread(target=self.get, name="dictionary-warm",
+                                  daemon=True)
+        thread.start()
+        return thread
+
+
+DICTIONARY = DictionaryLoader()
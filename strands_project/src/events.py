@@ -0,0 +1,72 @@
+"""
+Events emitted by StrandsGame (strands.py) to registered listeners.
+
+A front-end registers a listener with StrandsGame.add_listener and is
+then told about every change to the game state as it happens, so it
+can redraw only what changed (and nothing at all when a key press
+changed nothing) instead of polling the game after every key.
+
+Events are delivered after the game state has been updated, so a
+listener may query the game freely.
+"""
+from dataclasses import dataclass
+from typing import Callable, TypeAlias
+
+from base import StrandBase
+
+
+@dataclass(frozen=True)
+class ThemeWordFound:
+    """
+    A theme word was found (or revealed): the word, the index
+    of its answer, and the strand that was played for it.
+    """
+
+    word: str
+    answer: int
+    strand: StrandBase
+
+
+@dataclass(frozen=True)
+class DictionaryWordFound:
+    """
+    A dictionary word that is not a theme word was found
+    for the first time.
+    """
+
+    word: str
+
+
+@dataclass(frozen=True)
+class HintMeterChanged:
+    """
+    The hint meter moved, either up after a dictionary word
+    or down when a hint was used.
+    """
+
+    meter: int
+    threshold: int
+
+
+@dataclass(frozen=True)
+class HintActivated:
+    """
+    A hint was given for the answer with the given index. If
+    show_ends is True, the first and last letters of the hint
+    word should now be shown too.
+    """
+
+    answer: int
+    show_ends: bool
+
+
+@dataclass(frozen=True)
+class GameOver:
+    """
+    The last answer was found.
+    """
+
+
+GameEvent: TypeAlias = (ThemeWordFound | DictionaryWordFound
+                        | HintMeterChanged | HintActivated | GameOver)
+Listener: TypeAlias = Callable[[GameEvent], None]
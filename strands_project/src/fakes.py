@@ -21,16 +21,8 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from typing import TypeAlias
 from base import PosBase, StrandBase, BoardBase, StrandsGameBase, Step
-from collections import defaultdict
-
-usable_words = defaultdict(lambda: defaultdict(list))
-with open('assets/web2.txt') as file:
-    for line in file:
-        word = line.strip()
-        if len(word) > 3:
-            first = word[0].lower()
-            first_two = word[:2].lower()
-            usable_words[first][first_two].append(word)
+from dictionary import DICTIONARY
+from geometry import STEP_DELTAS, step_between
 
 Row: TypeAlias = int
 Col: TypeAlias = int
@@ -46,23 +38,14 @@ class Pos(PosBase):
     the top-left corner of a board, and row and column
     indices increase down and to the right, respectively.
     """
-    DIRECTIONS: dict[Step, tuple[int, int]] = {
-        'n' : (-1, 0),
-        's' : (1, 0),
-        'e': (0, 1), 
-        'w' : (0, -1),
-        'nw' : (-1, -1), 
-        'ne' : (-1, 1), 
-        'se' : (1, 1),
-        'sw' : (1, -1)
-    }
+    DIRECTIONS: dict[Step, tuple[int, int]] = STEP_DELTAS
 
     def take_step(self, step: Step) -> "Pos":
         """
         Compute the position that results from starting at
         the current position and taking the specified step.
         """
-        row_move, col_move = self.DIRECTIONS[step.value]
+        row_move, col_move = self.DIRECTIONS[step]
         return Pos(self.r + row_move, self.c + col_move)
 
     def step_to(self, other: "Pos") -> Step:
@@ -73,22 +56,17 @@ class Pos(PosBase):
         Raises ValueError if the other position is more
         than two steps away from self.
         """
-        row_move = other.r - self.r
-        col_move = other.c - self.c
-        for direction, (dir_row, dir_col) in self.DIRECTIONS.items():
-            if (dir_row, dir_col) == (row_move, col_move):
-                return Step(direction)
-        raise ValueError
+        step = step_between(self.r, self.c, other.r, other.c)
+        if step is None:
+            raise ValueError
+        return step
     
     def is_adjacent_to(self, other: "Pos") -> bool:
         """
         Decide whether or not the two positions are
         neighbors (that is, connected by a single step).
         """
-        try:
-            return self.step_to(other) in self.directions
-        except ValueError:
-            return False
+        return step_between(self.r, self.c, other.r, other.c) is not None
 
     def __eq__(self, other: object) -> bool:
         """
@@ -488,14 +466,8 @@ class StrandsGameFake(StrandsGameBase):
                 return(word, False)
         return 'Not a valid word'
     
-    def try_to_find_word(self, word):
-        first = word[0]
-        first_two = word[:2]
-        check = usable_words[first]
-        check_two = check[first_two]
-        if word in check_two:
-            return True
-        return False
+    def try_to_find_word(self, word: str) -> bool:
+        return word in DICTIONARY.get()
 
     def use_hint(self) -> tuple[int, bool] | str:
         """
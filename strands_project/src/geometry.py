@@ -0,0 +1,61 @@
+"""
+Step geometry shared by the game logic (strands.py, fakes.py)
+and the TUI (tui.py).
+
+Each Step maps to a (row, col) delta, and each delta in the 3x3
+neighborhood maps back to a Step through a flat table indexed by
+(dr + 1) * 3 + (dc + 1). Looking up the step between two cells, or
+deciding whether they are adjacent, is then a single index operation
+instead of a scan over the directions.
+"""
+from base import Step
+
+STEP_DELTAS: dict[Step, tuple[int, int]] = {
+    Step.N: (-1, 0),
+    Step.S: (1, 0),
+    Step.E: (0, 1),
+    Step.W: (0, -1),
+    Step.NW: (-1, -1),
+    Step.NE: (-1, 1),
+    Step.SE: (1, 1),
+    Step.SW: (1, -1),
+}
+
+# fixed order of the eight steps, used to index neighbor tables
+STEP_ORDER: list[Step] = list(Step)
+STEP_INDEX: dict[Step, int] = {step: i for i, step in enumerate(STEP_ORDER)}
+
+
+def delta_index(row_move: int, col_move: int) -> int:
+    """
+    Return the index of a delta in a flat 3x3 table, or -1
+    if the delta lies outside the 3x3 neighborhood.
+    """
+    if -1 <= row_move <= 1 and -1 <= col_move <= 1:
+        return (row_move + 1) * 3 + (col_move + 1)
+    return -1
+
+
+# DELTA_STEPS[delta_index(dr, dc)] is the step with that delta
+# (None for the center, which is not a step)
+DELTA_STEPS: tuple[Step | None, ...] = tuple(
+    next((step for step, delta in STEP_DELTAS.items()
+          if delta == (i // 3 - 1, i % 3 - 1)), None)
+    for i in range(9))
+
+
+def step_between(r1: int, c1: int, r2: int, c2: int) -> Step | None:
+    """
+    Return the step from (r1, c1) to (r2, c2), or None if
+    the two cells are not neighbors.
+    """
+    index = delta_index(r2 - r1, c2 - c1)
+    return DELTA_STEPS[index] if index >= 0 else None
+
+
+def is_adjacent(r1: int, c1: int, r2: int, c2: int) -> bool:
+    """
+    Decide whether or not two cells are neighbors
+    (that is, connected by a single step).
+    """
+    return step_between(r1, c1, r2, c2) is not None
@@ -0,0 +1,322 @@
+"""
+Keyboard input for the TUI (tui.py).
+
+KeyReader puts the terminal into raw mode once, for as long as it is
+entered as a context manager, instead of switching modes around every
+key press. Output post-processing is left on, so that newlines printed
+while the terminal is raw still return the cursor to the left margin.
+
+Input is read with selectors: read_keys waits for the terminal to
+become readable, then drains every byte already buffered and splits
+them into key events with split_keys, so that keys typed quickly (or
+auto-repeated) and delivered in a single read are not merged.
+
+Key events follow the TUI's long-standing convention: a printable
+character is a one-character string, a control character (such as 13
+for Enter or 27 for Escape) is its integer code, and an escape
+sequence (such as "\\033[A" for the up arrow) is a single string.
+
+ScriptedKeys offers the same interface over a fixed sequence of keys
+(for example, one read from a key script with parse_key_script), so
+the TUI can be driven without a terminal.
+"""
+import codecs
+import os
+import selectors
+import sys
+import termios
+import time
+import tty
+from collections import deque
+from typing import Iterable, Iterator, TypeAlias
+
+Key: TypeAlias = str | int
+
+ESC = "\033"
+
+# how long to wait for the rest of an escape sequence, in seconds
+ESCAPE_TIMEOUT = 0.05
+
+# names for keys that cannot be written as themselves in a key script
+KEY_NAMES: dict[str, Key] = {
+    "enter": 13,
+    "esc": 27,
+    "space": " ",
+}
+
+
+def char_key(char: str) -> Key:
+    """
+    Return the key event for a single character.
+    """
+    if ord(char) < 32 or ord(char) > 126:
+        return ord(char)
+    return char
+
+
+def split_keys(text: str, final: bool = True) -> tuple[list[Key], str]:
+    """
+    Split text read from the terminal into key events.
+
+    Returns the keys and any trailing text that may be the start
+    of an escape sequence still in flight. If final is True,
+    nothing is held back: an unfinished sequence is reported as
+    an Escape key followed by its remaining characters.
+    """
+    keys: list[Key] = []
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if char != ESC:
+            keys.append(char_key(char))
+            i += 1
+            continue
+        end = escape_end(text, i)
+        if end is None:
+            if not final:
+                return keys, text[i:]
+            keys.append(char_key(char))
+            i += 1
+        elif end == i + 1:
+            # Escape on its own (or followed by something that
+            # does not start a sequence)
+            keys.append(char_key(char))
+            i += 1
+        else:
+            keys.append(text[i:end])
+            i = end
+    return keys, ""
+
+
+def escape_end(text: str, start: int) -> int | None:
+    """
+    Return the index just past the escape sequence starting at
+    text[start], start + 1 if the Escape does not begin a
+    sequence, or None if the text ends before the sequence does.
+    """
+    if start + 1 == len(text):
+        return None
+    kind = text[start + 1]
+    if kind == "O":
+        # SS3 sequences (some terminals' arrow and function keys)
+        return start + 3 if start + 2 < len(text) else None
+    if kind != "[":
+        return start + 1
+    # CSI: parameter and intermediate bytes, then a final byte
+    for i in range(start + 2, len(text)):
+        if "\x40" <= text[i] <= "\x7e":
+            return i + 1
+        if not "\x20" <= text[i] <= "\x3f":
+            return start + 1
+    return None
+
+
+class KeyReader:
+    """
+    Reads key events from a terminal held in raw mode.
+    Entering the reader (as a context manager) switches the
+    terminal to raw mode, and leaving it restores the original
+    settings; nested entries are allowed. If the input is not
+    a terminal, its mode is left alone. Unless given a file
+    descriptor, the reader uses standard input, looked up when
+    it is first entered.
+    """
+
+    fd: int | None
+    _depth: int
+    _saved: list | None
+    _selector: selectors.BaseSelector | None
+    _decoder: codecs.IncrementalDecoder
+    _pending: str
+    _queue: deque[Key]
+    eof: bool
+
+    def __init__(self, fd: int | None = None):
+        """
+        Constructor
+        """
+        self.fd = fd
+        self._depth = 0
+        self._saved = None
+        self._selector = None
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._pending = ""
+        self._queue = deque()
+        # set once the input has ended
+        self.eof = False
+
+    def __enter__(self) -> "KeyReader":
+        if self._depth == 0:
+            if self.fd is None:
+                self.fd = sys.stdin.fileno()
+                self._decoder = codecs.getincrementaldecoder(
+                    sys.stdin.encoding or "utf-8")(errors="replace")
+            if os.isatty(self.fd):
+                self._saved = termios.tcgetattr(self.fd)
+                tty.setraw(self.fd)
+                # keep translating "\n" to "\r\n" on output
+                mode = termios.tcgetattr(self.fd)
+                mode[1] |= termios.OPOST | termios.ONLCR
+                termios.tcsetattr(self.fd, termios.TCSADRAIN, mode)
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self.fd, selectors.EVENT_READ)
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            if self._saved is not None and self.fd is not None:
+                termios.tcsetattr(self.fd, termios.TCSADRAIN, self._saved)
+                self._saved = None
+            if self._selector is not None:
+                self._selector.close()
+                self._selector = None
+
+    def _wait(self, timeout: float | None) -> bool:
+        """
+        Wait up to timeout seconds (forever if None) for input,
+        returning whether or not there is some to read.
+        """
+        if self._selector is None:
+            raise RuntimeError("KeyReader used outside a with block")
+        return bool(self._selector.select(timeout))
+
+    def _read_available(self) -> bool:
+        """
+        Read every byte the terminal has buffered and queue the
+        complete keys. Returns False at the end of the input.
+        """
+        assert self.fd is not None
+        while True:
+            data = os.read(self.fd, 4096)
+            if not data:
+                keys, _ = split_keys(self._pending, final=True)
+                self._queue.extend(keys)
+                self._pending = ""
+                self.eof = True
+                return False
+            text = self._pending + self._decoder.decode(data)
+            keys, self._pending = split_keys(text, final=False)
+            self._queue.extend(keys)
+            if not self._wait(0):
+                return True
+
+    def read_keys(self, timeout: float | None = None) -> list[Key]:
+        """
+        Return every key pressed so far, waiting up to timeout
+        seconds (forever if None) for at least one. Returns an
+        empty list if the wait timed out or the input ended
+        (in which case eof is set).
+        """
+        if not self._queue and not self.eof:
+            more = True
+            if self._wait(timeout):
+                more = self._read_available()
+            # give an unfinished escape sequence a moment to arrive
+            while more and self._pending:
+                if self._wait(ESCAPE_TIMEOUT):
+                    more = self._read_available()
+                else:
+                    keys, self._pending = split_keys(self._pending)
+                    self._queue.extend(keys)
+        keys = list(self._queue)
+        self._queue.clear()
+        return keys
+
+    def read_key(self) -> Key:
+        """
+        Return the next key, waiting for one if need be.
+
+        Raises EOFError if the input ends first.
+        """
+        if not self._queue:
+            keys = self.read_keys()
+            if not keys:
+                raise EOFError("end of keyboard input")
+            self._queue.extend(keys)
+        return self._queue.popleft()
+
+
+def parse_key_script(text: str) -> list[Key]:
+    """
+    Return the keys in a key script: whitespace-separated keys,
+    each either a single printable character or one of the names
+    in KEY_NAMES. Lines starting with # are comments.
+
+    Raises ValueError if a key is neither.
+    """
+    keys: list[Key] = []
+    for line in text.splitlines():
+        if line.lstrip().startswith("#"):
+            continue
+        for token in line.split():
+            if token.lower() in KEY_NAMES:
+                keys.append(KEY_NAMES[token.lower()])
+            elif len(token) == 1:
+                keys.append(char_key(token))
+            else:
+                raise ValueError(f"Unknown key in script: {token}")
+    return keys
+
+
+class ScriptedKeys:
+    """
+    A stand-in for KeyReader that hands out a fixed sequence of
+    keys, one per call to read_keys, without ever waiting. It
+    records, for each key, the time from handing it out until
+    the next call (or finish()), that is, how long the caller
+    took to handle it.
+    """
+
+    latencies: list[float]
+    eof: bool
+    _keys: Iterator[Key]
+    _started: float | None
+
+    def __init__(self, keys: Iterable[Key]):
+        """
+        Constructor
+        """
+        self._keys = iter(keys)
+        self._started = None
+        self.latencies = []
+        self.eof = False
+
+    def __enter__(self) -> "ScriptedKeys":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        pass
+
+    def finish(self) -> None:
+        """
+        Stop timing the key handed out last, if any.
+        """
+        if self._started is not None:
+            self.latencies.append(time.perf_counter() - self._started)
+            self._started = None
+
+    def read_keys(self, timeout: float | None = None) -> list[Key]:
+        """
+        Return the next key of the script (as a one-key list),
+        or an empty list once the script is used up (in which
+        case eof is set).
+        """
+        self.finish()
+        for key in self._keys:
+            self._started = time.perf_counter()
+            return [key]
+        self.eof = True
+        return []
+
+    def read_key(self) -> Key:
+        """
+        Return the next key of the script.
+
+        Raises EOFError if the script is used up.
+        """
+        keys = self.read_keys()
+        if not keys:
+            raise EOFError("end of key script")
+        return keys[0]
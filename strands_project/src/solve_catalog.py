@@ -0,0 +1,83 @@
+"""
+Solve every puzzle in the catalog across a pool of worker processes.
+
+Run from the project directory:
+
+    $python3 src/solve_catalog.py [EXTRA_DIR ...] [-j WORKERS]
+
+Every .txt game file in boards/ (and in any extra directories) is
+loaded and solved with strands.solve. Each worker opens the
+dictionary once, when it starts, and results are streamed to stdout
+as one JSON object per line, in the order the boards finish.
+"""
+import json
+import os
+import time
+from multiprocessing import Pool
+from typing import Any
+
+import click
+
+from dictionary import DICTIONARY
+from strands import StrandsGame, solve
+
+
+def init_worker() -> None:
+    """
+    Open the dictionary once per worker process.
+    """
+    DICTIONARY.get()
+
+
+def solve_game_file(path: str) -> dict[str, Any]:
+    """
+    Load and solve a single game file, returning a summary of
+    the solution (or the error, if the game file is invalid).
+    Only the solve itself is timed, not loading the game.
+    """
+    try:
+        game = StrandsGame(path)
+    except (ValueError, OSError) as error:
+        return {"board": path, "error": str(error)}
+    start = time.perf_counter()
+    solutions = solve(game.board())
+    elapsed = time.perf_counter() - start
+
+    theme_words = [word for word, _ in game.answers()]
+    return {
+        "board": path,
+        "theme": game.theme(),
+        "words": len(solutions),
+        "strands": sum(len(strands) for strands in solutions.values()),
+        "longest": max(solutions, key=len, default=""),
+        "theme_words_found": sum(word in solutions for word in theme_words),
+        "theme_words": len(theme_words),
+        "solve_ms": round(elapsed * 1000, 2),
+    }
+
+
+def game_files(directories: list[str]) -> list[str]:
+    """
+    Return the sorted paths of the .txt files in each directory.
+    """
+    paths = []
+    for directory in directories:
+        for fname in sorted(os.listdir(directory)):
+            if fname.endswith(".txt"):
+                paths.append(os.path.join(directory, fname))
+    return paths
+
+
+@click.command()
+@click.argument('directories', nargs=-1, type=click.Path(exists=True, file_okay=False))
+@click.option('-j', '--workers', default=os.cpu_count() or 1, type=click.IntRange(min=1), help="Number of worker processes.")
+@click.option('--no-default', is_flag=True, help="Skip the boards/ directory.")
+def main(directories: tuple[str, ...], workers: int, no_default: bool) -> None:
+    dirs = list(directories) if no_default else ["boards", *directories]
+    paths = game_files(dirs)
+    with Pool(workers, initializer=init_worker) as pool:
+        for result in pool.imap_unordered(solve_game_file, paths):
+            print(json.dumps(result), flush=True)
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,40 @@
 from abc import ABC, abstractmethod
+from array import array
+from dataclasses import dataclass
 from enum import Enum
-from typing import TypeAlias
+from functools import cache
+from types import ModuleType
+from typing import TYPE_CHECKING, Iterable, Sequence, TypeAlias
+import hashlib
+import os
+import pickle
+import threading
 from base import PosBase, StrandBase, BoardBase, StrandsGameBase, Step
-from collections import defaultdict
+from dictionary import DICTIONARY, ROOT
+from geometry import STEP_DELTAS, STEP_ORDER, STEP_INDEX, step_between
+from events import (GameEvent, Listener, ThemeWordFound, DictionaryWordFound,
+                    HintMeterChanged, HintActivated, GameOver)
 
-usable_words: dict[str, dict[str, list[str]]] = defaultdict(lambda: defaultdict(list))
-with open('assets/web2.txt') as file:
-    for line in file:
-        word = line.strip()
-        if len(word) > 3:
-            first = word[0].lower()
-            first_two = word[:2].lower()
-            usable_words[first][first_two].append(word)
+if TYPE_CHECKING:
+    import numpy as np
+
+# batches of fewer strands than this are spelled one strand at a
+# time, since setting up the NumPy arrays costs more than it saves
+# (and loading a game then never needs to import NumPy)
+NUMPY_MIN_BATCH = 64
+
+@cache
+def _numpy() -> ModuleType | None:
+    """
+    Return the numpy module, or None if it is not installed.
+    NumPy is optional and slow to import, so it is only imported
+    the first time a large batch of strands is evaluated.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
 
 Row: TypeAlias = int
 Col: TypeAlias = int
@@ -20,26 +43,59 @@ Create a file with four classes, Pos, Strand, Board, and
 StrandsGame that inherit from the corresponding base classes.
 """
 class Pos(PosBase):
+    """
+    Immutable, hashable positions. The (r, c) pair is kept as a
+    cached key, so positions can be used in sets and as dict keys.
+    """
+
+    __slots__ = ("r", "c", "_key", "_hash")
+
+    _key: tuple[int, int]
+    _hash: int
 
+    # step value -> (row, col) delta; see geometry.STEP_DELTAS
     DIRECTIONS: dict[str, tuple[int, int]] = {
-        'n' : (-1, 0),
-        's' : (1, 0),
-        'e': (0, 1), 
-        'w' : (0, -1),
-        'nw' : (-1, -1), 
-        'ne' : (-1, 1), 
-        'se' : (1, 1),
-        'sw' : (1, -1)
+        step.value: delta for step, delta in STEP_DELTAS.items()
     }
     def __init__(self, r: int, c: int) -> None:
-        super().__init__(r, c)
+        # PosBase.__init__ would assign through __setattr__
+        object.__setattr__(self, "r", r)
+        object.__setattr__(self, "c", c)
+        object.__setattr__(self, "_key", (r, c))
+        object.__setattr__(self, "_hash", hash((r, c)))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"Pos is immutable (cannot set {name})")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Pos is immutable (cannot delete {name})")
+
+    def __reduce__(self) -> tuple[type["Pos"], tuple[int, int]]:
+        return (Pos, self._key)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Pos):
+            return self._key == other._key
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"Pos({self.r}, {self.c})"
+
+    def key(self) -> tuple[int, int]:
+        """
+        Return the (row, col) pair identifying the position.
+        """
+        return self._key
 
     def take_step(self, step: Step) -> "Pos":
         """
         Compute the position that results from starting at
         the current position and taking the specified step.
         """
-        row_move, col_move = self.DIRECTIONS[step.value]
+        row_move, col_move = STEP_DELTAS[step]
         return Pos(self.r + row_move, self.c + col_move)
 
     def step_to(self, other: "Pos") -> Step:
@@ -50,22 +106,85 @@ class Pos(PosBase):
         Raises ValueError if the other position is more
         than two steps away from self.
         """
-        row_move = other.r - self.r
-        col_move = other.c - self.c
-        for direction, (dir_row, dir_col) in self.DIRECTIONS.items():
-            if (dir_row, dir_col) == (row_move, col_move):
-                return Step(direction)
-        raise ValueError
+        step = step_between(self.r, self.c, other.r, other.c)
+        if step is None:
+            raise ValueError(f"{other} is not adjacent to {self}")
+        return step
     
     def is_adjacent_to(self, other: "Pos") -> bool:
-        try:
-            return self.step_to(other) in self.DIRECTIONS
-        except ValueError:
-            return False
+        """
+        Decide whether or not the two positions are
+        neighbors (that is, connected by a single step).
+        """
+        return step_between(self.r, self.c, other.r, other.c) is not None
 
 class Strand(StrandBase):
-    def __init__(self, start: Pos, steps: list[Step]) -> None:
-        super().__init__(start, steps)
+    """
+    Immutable, hashable strands. The start position and steps
+    are fixed at construction (the steps are kept as a tuple, and
+    the steps attribute hands out a fresh list each time), and the
+    (start, steps) pair is kept as a cached key for hashing.
+
+    Because a strand never changes, the positions it visits are
+    computed at most once, and so is its sequence of flat cell
+    indices (row * cols + col) for the board shape last asked
+    for by cells().
+    """
+
+    start: Pos
+    _steps: tuple[Step, ...]
+    _key: tuple[tuple[int, int], tuple[Step, ...]]
+    _hash: int
+    _positions: tuple[Pos, ...] | None
+    _cells: tuple[tuple[int, int], array] | None
+
+    def __init__(self, start: Pos, steps: Sequence[Step]) -> None:
+        object.__setattr__(self, "start", start)
+        object.__setattr__(self, "_steps", tuple(steps))
+        object.__setattr__(self, "_key", (start.key(), self._steps))
+        object.__setattr__(self, "_hash", hash(self._key))
+        object.__setattr__(self, "_positions", None)
+        object.__setattr__(self, "_cells", None)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"Strand is immutable (cannot set {name})")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Strand is immutable (cannot delete {name})")
+
+    def __reduce__(self) -> tuple[type["Strand"],
+                                  tuple[Pos, tuple[Step, ...]]]:
+        return (Strand, (self.start, self._steps))
+
+    @property
+    def steps(self) -> list[Step]:
+        """
+        Return the steps of the strand, as a new list (so
+        changing it does not change the strand).
+        """
+        return list(self._steps)
+
+    @steps.setter
+    def steps(self, steps: list[Step]) -> None:
+        raise AttributeError("Strand is immutable (cannot set steps)")
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Strand):
+            return self._key == other._key
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        steps = ", ".join(step.value for step in self._steps)
+        return f"Strand({self.start!r}, [{steps}])"
+
+    def key(self) -> tuple[tuple[int, int], tuple[Step, ...]]:
+        """
+        Return the (start, steps) pair identifying the strand.
+        """
+        return self._key
 
     def positions(self) -> list[Pos]:
         """
@@ -75,14 +194,44 @@ class Strand(StrandBase):
         positions assume a board of infinite size in all
         directions.
         """
-        positions_list = []
-        positions_list.append(self.start)
-        current_location = self.start
-        for step in self.steps:
-            new_location = current_location.take_step(step)
-            positions_list.append(new_location)
-            current_location = new_location
-        return positions_list
+        return list(self._walk())
+
+    def _walk(self) -> tuple[Pos, ...]:
+        """
+        Return the cached positions of the strand,
+        computing them on first use.
+        """
+        positions = self._positions
+        if positions is None:
+            current_location = self.start
+            positions_list: list[Pos] = [current_location]
+            for step in self._steps:
+                current_location = current_location.take_step(step)
+                positions_list.append(current_location)
+            positions = tuple(positions_list)
+            object.__setattr__(self, "_positions", positions)
+        return positions
+
+    def cells(self, num_rows: int, num_cols: int) -> array:
+        """
+        Return the flat cell indices (row * num_cols + col)
+        visited by the strand on a board of the given shape,
+        as an array of ints. The array is cached and shared,
+        so it must not be modified.
+
+        Raises ValueError if any of the strand's positions
+        are not within the bounds of such a board.
+        """
+        cached = self._cells
+        if cached is not None and cached[0] == (num_rows, num_cols):
+            return cached[1]
+        cells = array("l")
+        for pos in self._walk():
+            if not (0 <= pos.r < num_rows and 0 <= pos.c < num_cols):
+                raise ValueError("p out of bounds")
+            cells.append(pos.r * num_cols + pos.c)
+        object.__setattr__(self, "_cells", ((num_rows, num_cols), cells))
+        return cells
 
     def is_cyclic(self) -> bool:
         """
@@ -90,16 +239,8 @@ class Strand(StrandBase):
         check whether or not any position appears multiple
         times in the strand.
         """
-        visited: set[tuple[int,int]] = set()
-        cur = self.start
-        visited.add((cur.r, cur.c))
-        for step in self.steps:
-            cur = cur.take_step(step)
-            key = (cur.r, cur.c)
-            if key in visited:
-                return True
-            visited.add(key)
-        return False
+        positions = self._walk()
+        return len(set(positions)) != len(positions)
 
     def is_folded(self) -> bool:
         """
@@ -107,36 +248,44 @@ class Strand(StrandBase):
         check whether or not any connection in the strand
         crosses over another connection in the strand.
         """
-        if len(self.steps) < 2:
-            return False
-        pos_list: list[Pos] = [self.start]
-        cur = self.start
-        for st in self.steps:
-            cur = cur.take_step(st)
-            pos_list.append(cur)
-
-        mids: list[tuple[float, float]] = []
-        for k in range(len(pos_list) - 1):
-            cur = pos_list[k]
-            next = pos_list[k + 1]
-            mids.append(((cur.r + next.r) / 2.0, (cur.c + next.c) / 2.0))
-
-        # now there's a complete list of mid point of every 2
-        # adjacent edges
-        # For 2 different edges, 
-        # if 2 mid points are the same, there's a cross
-        # between diagonal path
-        # this is valid because the diagonal path can only 
-        # go to NE,SE,NW and SW
-
-        for i, m1 in enumerate(mids):
-            # check the edges that are at leeast 2 letters away
-            # so that we are not counting the same edge
-            # or 2 edges with a communal letter vertex
-            for j in range(i+2, len(mids)):
-                if m1 == mids[j]:
-                    return True         
-        return False
+        return _is_folded(self.start.r, self.start.c, self._steps, {})
+
+def _is_folded(r: int, c: int, steps: Sequence[Step],
+               seen: dict[tuple[int, int], int]) -> bool:
+    """
+    Decide whether or not the strand starting at (r, c) with the
+    given steps is folded, in a single pass over the steps.
+
+    Two connections cross exactly when they share a midpoint, so
+    each connection is keyed by its midpoint doubled (the integer
+    pair (r1 + r2, c1 + c2)), remembering the first connection with
+    that key. Connections next to each other share a letter rather
+    than crossing, so only a match at least two connections back
+    counts. (A straight connection can only share its midpoint with
+    itself, i.e. when the strand retraces an edge, which is also
+    reported as a fold.) seen is scratch space and must start empty.
+    """
+    for i, step in enumerate(steps):
+        row_move, col_move = STEP_DELTAS[step]
+        first = seen.setdefault((2 * r + row_move, 2 * c + col_move), i)
+        if first <= i - 2:
+            return True
+        r += row_move
+        c += col_move
+    return False
+
+def are_folded(strands: Iterable[StrandBase]) -> list[bool]:
+    """
+    Decide, for each of many strands, whether or not it is
+    folded (see Strand.is_folded), reusing one scratch table.
+    """
+    seen: dict[tuple[int, int], int] = {}
+    results = []
+    for strand in strands:
+        results.append(_is_folded(strand.start.r, strand.start.c,
+                                  strand.steps, seen))
+        seen.clear()
+    return results
 
 class Board(BoardBase):
     def __init__(self, letters: list[list[str]]):
@@ -168,93 +317,362 @@ class Board(BoardBase):
                 new_row.append(elem.lower())
             self._rows.append(new_row)
 
+        # one interned Pos per cell, plus a table of neighboring
+        # cells, both indexed by flat cell index (row * cols + col)
+        self._num_rows = len(self._rows)
+        self._num_cols = len(self._rows[0])
+        cols = self._num_cols
+        self._letters = [letter for row in self._rows for letter in row]
+        self._cells = [Pos(i // cols, i % cols)
+                       for i in range(self._num_rows * cols)]
+        self._step_table: list[tuple[int, ...]] = []
+        for pos in self._cells:
+            neighbors = []
+            for step in STEP_ORDER:
+                row_move, col_move = STEP_DELTAS[step]
+                r, c = pos.r + row_move, pos.c + col_move
+                if 0 <= r < self._num_rows and 0 <= c < cols:
+                    neighbors.append(r * cols + c)
+                else:
+                    neighbors.append(-1)
+            self._step_table.append(tuple(neighbors))
+
+        # the letters as a flat uint8 array, for batch evaluation
+        # (built on first use; see _flat_codes)
+        self._codes: "np.ndarray | None" = None
+
     def num_rows(self) -> int:
-        return len(self._rows)
+        return self._num_rows
 
     def num_cols(self) -> int:
-        return len(self._rows[0])
+        return self._num_cols
 
-    def get_letter(self, pos: Pos) -> str:
-        # check if the position is in bound
-        if pos.r < 0 or pos.r >= len(self._rows):
+    def _index(self, pos: PosBase) -> int:
+        """
+        Return the flat cell index of a position.
+
+        Raises ValueError if the position is out of bounds.
+        """
+        if not (0 <= pos.r < self._num_rows and 0 <= pos.c < self._num_cols):
             raise ValueError("p out of bounds")
-        if pos.c < 0 or pos.c >= len(self._rows[pos.r]):
+        return pos.r * self._num_cols + pos.c
+
+    def pos(self, r: int, c: int) -> Pos:
+        """
+        Return the board's single, shared Pos for (r, c).
+
+        Raises ValueError if the position is out of bounds.
+        """
+        if not (0 <= r < self._num_rows and 0 <= c < self._num_cols):
             raise ValueError("p out of bounds")
-        return self._rows[pos.r][pos.c]
+        return self._cells[r * self._num_cols + c]
+
+    def flat_letters(self) -> list[str]:
+        """
+        Return the board's letters indexed by flat cell index
+        (row * cols + col). The list is shared, so it must not
+        be modified.
+        """
+        return self._letters
+
+    def step_table(self) -> list[tuple[int, ...]]:
+        """
+        Return the board's neighbor table: for each flat cell
+        index, the flat index of the cell one step away in each
+        direction of geometry.STEP_ORDER, or -1 where that step
+        leaves the board. The table is shared, so it must not
+        be modified.
+        """
+        return self._step_table
+
+    def neighbor(self, pos: PosBase, step: Step) -> Pos | None:
+        """
+        Return the board's Pos one step away from pos,
+        or None if that step leaves the board.
+        """
+        index = self._step_table[self._index(pos)][STEP_INDEX[step]]
+        return self._cells[index] if index >= 0 else None
+
+    def strand_cells(self, strand: StrandBase) -> Sequence[int]:
+        """
+        Return the flat cell indices visited by a strand
+        (cached on the strand itself for Strand objects).
+
+        Raises ValueError if any of the strand's positions
+        are not within the bounds of the board.
+        """
+        if isinstance(strand, Strand):
+            return strand.cells(self._num_rows, self._num_cols)
+        index = self._index(strand.start)
+        cells = [index]
+        step_table = self._step_table
+        for step in strand.steps:
+            index = step_table[index][STEP_INDEX[step]]
+            if index < 0:
+                raise ValueError("p out of bounds")
+            cells.append(index)
+        return cells
+
+    def strand_positions(self, strand: StrandBase) -> list[Pos]:
+        """
+        Return the board's shared Pos objects visited by a strand.
+
+        Raises ValueError if any of the strand's positions
+        are not within the bounds of the board.
+        """
+        cells = self._cells
+        return [cells[index] for index in self.strand_cells(strand)]
+
+    def get_letter(self, pos: Pos) -> str:
+        # check if the position is in bound
+        return self._letters[self._index(pos)]
+
+    def spell(self, cells: Iterable[int]) -> str:
+        """
+        Return the letters at a sequence of flat cell indices.
+        """
+        letters = self._letters
+        return "".join([letters[index] for index in cells])
 
     def evaluate_strand(self, strand: Strand) -> str:
-        letters: list[str] = []
-        positions = strand.positions()    
-        for pos in positions:
-            '''
-            if not (0 <= pos.r < self.num_rows()):
-                raise ValueError("Position row out of bounds")
-            if not (0 <= pos.c < self.num_cols()):
-                raise ValueError("Position col out of bounds")
-            '''
-            letter = self.get_letter(pos).lower()
-            letters.append(letter)
-
-        result = ""
-        for ch in letters:
-            result += ch
-        return result
+        return self.spell(self.strand_cells(strand))
 
-class StrandsGame(StrandsGameBase):
-    def __init__(self, game_file: str | list[str], hint_threshold: int = 3):
+    def _flat_codes(self) -> "np.ndarray | None":
+        """
+        Return the board's letters as a flat, read-only NumPy
+        array of uint8 character codes, or None if NumPy is not
+        available or the letters are not all ASCII.
+        """
+        np = _numpy()
+        if np is None:
+            return None
+        if self._codes is None:
+            text = "".join(self._letters)
+            if not text.isascii():
+                return None
+            self._codes = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+        return self._codes
+
+    def letter_codes(self) -> "np.ndarray | None":
+        """
+        Return the board's letters as a read-only (rows, cols)
+        NumPy array of uint8 character codes, or None if NumPy
+        is not available or the letters are not all ASCII.
+        """
+        codes = self._flat_codes()
+        if codes is None:
+            return None
+        return codes.reshape(self._num_rows, self._num_cols)
+
+    def evaluate_strands(self, strands: Iterable[StrandBase]) -> list[str]:
+        """
+        Return the string spelled by each of many strands.
+
+        With NumPy, and at least NUMPY_MIN_BATCH strands, the
+        positions of every strand are computed together by a
+        cumulative sum over their steps, checked against the board
+        with one vectorized mask, and looked up with a single fancy
+        index. Otherwise each strand is evaluated in turn.
+
+        Raises ValueError if any of the strands' positions are
+        not within the bounds of the board.
+        """
+        strands = list(strands)
+        codes = self._flat_codes() if len(strands) >= NUMPY_MIN_BATCH \
+            else None
+        if codes is None:
+            return [self.spell(self.strand_cells(strand))
+                    for strand in strands]
+        np = _numpy()
+        assert np is not None
+        step_rows, step_cols = _step_moves()
+
+        lengths = np.fromiter((len(strand.steps) + 1 for strand in strands),
+                              dtype=np.intp, count=len(strands))
+        ends = np.cumsum(lengths)
+        starts = ends - lengths
+
+        # one move per cell: the step into that cell, or for the
+        # first cell of each strand, a jump to its start position
+        moves = np.fromiter((STEP_INDEX[step] for strand in strands
+                             for step in strand.steps),
+                            dtype=np.intp, count=int(ends[-1]) - len(strands))
+        is_step = np.ones(int(ends[-1]), dtype=bool)
+        is_step[starts] = False
+        row_moves = np.empty(int(ends[-1]), dtype=np.intp)
+        col_moves = np.empty(int(ends[-1]), dtype=np.intp)
+        row_moves[is_step] = step_rows[moves]
+        col_moves[is_step] = step_cols[moves]
+        row_moves[starts] = [strand.start.r for strand in strands]
+        col_moves[starts] = [strand.start.c for strand in strands]
+        rows = _segment_cumsum(row_moves, starts, lengths)
+        cols = _segment_cumsum(col_moves, starts, lengths)
+
+        in_bounds = ((rows >= 0) & (rows < self._num_rows)
+                     & (cols >= 0) & (cols < self._num_cols))
+        if not in_bounds.all():
+            first = int(np.argmin(in_bounds))
+            num_strand = int(np.searchsorted(ends, first, side="right"))
+            raise ValueError(f"strand {num_strand} is out of bounds")
+
+        text = codes[rows * self._num_cols + cols].tobytes() \
+            .decode("ascii")
+        return [text[start:end] for start, end
+                in zip(starts.tolist(), ends.tolist())]
+
+@cache
+def _step_moves() -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    Return the row and column moves of each step, in STEP_ORDER,
+    as NumPy arrays (only called once NumPy is known to be there).
+    """
+    np = _numpy()
+    assert np is not None
+    return (np.array([STEP_DELTAS[step][0] for step in STEP_ORDER],
+                     dtype=np.intp),
+            np.array([STEP_DELTAS[step][1] for step in STEP_ORDER],
+                     dtype=np.intp))
+
+def _segment_cumsum(values: "np.ndarray", starts: "np.ndarray",
+                    lengths: "np.ndarray") -> "np.ndarray":
+    """
+    Return the running totals of values, restarting at each
+    index in starts (the first of each run of lengths values).
+    """
+    np = _numpy()
+    assert np is not None
+    totals = np.cumsum(values)
+    before = totals[starts] - values[starts]
+    return totals - np.repeat(before, lengths)
+
+def solve(board: Board, min_length: int = 4) -> dict[str, list[Strand]]:
+    """
+    Find every dictionary word of at least min_length letters
+    that can be traced on the board as a non-cyclic strand.
+
+    Returns a dictionary mapping each word to every strand that
+    spells it. The search walks the board and the dictionary trie
+    together, abandoning a path as soon as its letters stop being
+    a prefix of any word. Cells are flat indices (row * cols + col),
+    with their letters and neighbors taken from the board's own
+    tables, and the cells on the current path are tracked in a
+    bitmask.
+    """
+    words = DICTIONARY.get()
+    child = words.child
+    is_word_node = words.is_word_node
+    cols = board.num_cols()
+    letters = board.flat_letters()
+    # the board's neighbor table, without the steps off the board
+    neighbors: list[list[tuple[int, Step]]] = [
+        [(next_cell, step) for step, next_cell in zip(STEP_ORDER, row)
+         if next_cell >= 0]
+        for row in board.step_table()]
+
+    found: dict[str, list[tuple[int, tuple[Step, ...]]]] = {}
+    spelled: list[str] = []
+    steps: list[Step] = []
+
+    def extend(cell: int, node: int, visited: int, start: int) -> None:
+        spelled.append(letters[cell])
+        if len(spelled) >= min_length and is_word_node(node):
+            found.setdefault("".join(spelled), []).append((start, tuple(steps)))
+        for next_cell, step in neighbors[cell]:
+            if visited >> next_cell & 1:
+                continue
+            next_node = child(node, letters[next_cell])
+            if next_node >= 0:
+                steps.append(step)
+                extend(next_cell, next_node, visited | 1 << next_cell, start)
+                steps.pop()
+        spelled.pop()
+
+    for start in range(len(letters)):
+        node = child(ROOT, letters[start])
+        if node >= 0:
+            extend(start, node, 1 << start, start)
 
-        if isinstance(game_file, str):
-            with open(game_file) as file:
-                raw_lines = file.readlines()
-        else:
-            raw_lines = game_file
+    solutions: dict[str, list[Strand]] = {}
+    for word in sorted(found):
+        solutions[word] = [Strand(board.pos(*divmod(start, cols)), path)
+                           for start, path in found[word]]
+    return solutions
 
-        self.game_file: list[str] = []
-        for ln in raw_lines:
-            self.game_file.append(ln.rstrip("\n"))
+@dataclass(frozen=True)
+class GameSpec:
+    """
+    The immutable, validated contents of a game file: the theme,
+    the board, and the answers (each a lowercase theme word and
+    its strand). Build one with GameSpec.from_lines, or through
+    load_game_spec to reuse specs that have already been built.
+    """
+
+    theme: str
+    board: Board
+    answers: tuple[tuple[str, Strand], ...]
+
+    @classmethod
+    def from_lines(cls, lines: list[str]) -> "GameSpec":
+        """
+        Parse and validate the lines of a game file (see
+        StrandsGameBase.__init__ for the format).
+
+        Raises ValueError if the game file is invalid.
+        """
+        game_file: list[str] = []
+        for ln in lines:
+            game_file.append(ln.rstrip("\n"))
         # now, the lines are handled
 
         num_empty_rows = 0
         check_flag = 0
-        self.board_start = None
-        self.answers_start = None
+        board_start = None
+        answers_start = None
 
-        for line_num, line in enumerate(self.game_file):
+        for line_num, line in enumerate(game_file):
             if line.strip() == "":
                 num_empty_rows += 1
 
             if num_empty_rows == 1 and check_flag == 0:
                 # first time seeing an empty row, 
                 # next line should be board
-                self.board_start = line_num + 1
+                board_start = line_num + 1
                 check_flag = 1
             
             elif num_empty_rows == 2:
                 # similarly, but next line is answer
-                self.answers_start = line_num + 1
+                answers_start = line_num + 1
                 break
 
         # 1. handle theme
-        self.theme_line = self.game_file[0].strip()
-        if self.theme_line == "":
+        theme_line = game_file[0].strip() if game_file else ""
+        if theme_line == "":
             raise ValueError("Theme line is empty")
         
         # 2. lack enough blank rows, raise value error
-        if self.board_start is None or self.answers_start is None:
+        if board_start is None or answers_start is None:
             raise ValueError("Game file missing blank-line separators")
 
-        self._board = self.board()
+        final_board = []
+        for row in game_file[board_start:]:
+            if row.strip() == "":
+                break
+            # drop all spaces, lowercase, split into letters
+            tokens = row.split()
+            clean_row = [token.lower() for token in tokens if token.isalpha()]
+            final_board.append(clean_row)
+        board = Board(final_board)
 
         answer_lines: list[str] = []
-        i_ans = self.answers_start
-        while i_ans < len(self.game_file) and self.game_file[i_ans].strip() != "":
-            answer_lines.append(self.game_file[i_ans])
+        i_ans = answers_start
+        while i_ans < len(game_file) and game_file[i_ans].strip() != "":
+            answer_lines.append(game_file[i_ans])
             i_ans += 1
 
         if len(answer_lines) == 0:
             raise ValueError("Answers block is empty")
 
-        self._answers: list[tuple[str, Strand]] = []
+        answers: list[tuple[str, Strand]] = []
 
         for ln in answer_lines:
             toks = ln.split()
@@ -271,40 +689,183 @@ class StrandsGame(StrandsGameBase):
             steps = [Step(tok.lower()) for tok in toks[3:]]
             strand = Strand(Pos(r, c), steps)
 
-            spelled = self._board.evaluate_strand(strand)
+            answers.append((word, strand))
+
+        # spell every answer strand in one batch
+        spellings = board.evaluate_strands(strand for _, strand in answers)
+        for (word, strand), spelled in zip(answers, spellings):
             if spelled != word:
                 raise ValueError("Wrong Spelling!")
             if strand.is_folded():
                 raise ValueError("No Folding!")
 
-            self._answers.append((word, strand))
+        check_coverage(board, answers)
+
+        # debugged: strip the """ mark
+        return cls(theme_line.strip('"'), board, tuple(answers))
+
+
+def check_coverage(board: Board, answers: list[tuple[str, Strand]]) -> None:
+    """
+    Check that the answers fill the board without overlapping.
+
+    Each answer strand becomes a bitmask over the board's cells
+    (bit row * cols + col), and a single pass accumulates the
+    cells covered so far and the cells covered more than once.
+
+    Raises ValueError naming the offending cells, using the
+    1-indexed (row, col) coordinates of the game file.
+    """
+    rows = board.num_rows()
+    cols = board.num_cols()
+    covered = 0
+    overlap = 0
+    for _, strand in answers:
+        strand_mask = 0
+        for index in board.strand_cells(strand):
+            bit = 1 << index
+            # a cyclic strand overlaps itself
+            overlap |= strand_mask & bit
+            strand_mask |= bit
+        overlap |= covered & strand_mask
+        covered |= strand_mask
+
+    if overlap:
+        raise ValueError(f"Answers overlap at {describe_cells(overlap, cols)}")
+    missing = ((1 << (rows * cols)) - 1) & ~covered
+    if missing:
+        raise ValueError(f"Answers do not cover {describe_cells(missing, cols)}")
+
+
+def describe_cells(mask: int, cols: int) -> str:
+    """
+    List the cells set in a bitmask as 1-indexed (row, col) pairs.
+    """
+    cells = []
+    index = 0
+    while mask:
+        if mask & 1:
+            cells.append(f"({index // cols + 1}, {index % cols + 1})")
+        mask >>= 1
+        index += 1
+    return ", ".join(cells)
+
+
+# Bump whenever GameSpec (or the classes it holds) changes shape,
+# so that stale on-disk cache entries are ignored
+SPEC_FORMAT_VERSION = 4
+
+_spec_cache: dict[bytes, GameSpec] = {}
+_spec_cache_lock = threading.Lock()
+
+
+def load_game_spec(game_file: str | list[str],
+                   cache_dir: str | None = None) -> GameSpec:
+    """
+    Return the GameSpec for a game file, given either as a
+    filename or as a list of lines.
+
+    Specs are cached in-process, keyed by a hash of the file's
+    contents, so each distinct game is parsed and validated once.
+    If cache_dir is given, specs are also pickled there (one file
+    per content hash) and reused by later processes.
+
+    Raises ValueError if the game file is invalid.
+    """
+    if isinstance(game_file, str):
+        with open(game_file) as file:
+            lines = file.readlines()
+    else:
+        lines = list(game_file)
+
+    digest = hashlib.sha256("\0".join(lines).encode()).digest()
+    spec = _spec_cache.get(digest)
+    if spec is not None:
+        return spec
+
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = os.path.join(
+            cache_dir, f"{digest.hex()}.v{SPEC_FORMAT_VERSION}.pickle")
+        try:
+            with open(cache_path, "rb") as file:
+                cached = pickle.load(file)
+            if isinstance(cached, GameSpec):
+                spec = cached
+        except (OSError, pickle.UnpicklingError, EOFError,
+                AttributeError, ImportError, TypeError):
+            spec = None
+
+    if spec is None:
+        spec = GameSpec.from_lines(lines)
+        if cache_path is not None:
+            try:
+                os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+                temp = f"{cache_path}.{os.getpid()}.tmp"
+                with open(temp, "wb") as file:
+                    pickle.dump(spec, file)
+                os.replace(temp, cache_path)
+            except OSError:
+                pass
+
+    with _spec_cache_lock:
+        return _spec_cache.setdefault(digest, spec)
+
+
+class StrandsGame(StrandsGameBase):
+
+    # If set, validated game specs are also cached on disk here
+    spec_cache_dir: str | None = None
+
+    def __init__(self, game_file: str | list[str], hint_threshold: int = 3):
+
+        self._spec = load_game_spec(game_file, self.spec_cache_dir)
+        self._board = self._spec.board
+        self._answers: list[tuple[str, Strand]] = list(self._spec.answers)
+
+        # indexes so that submit_strand costs O(strand length)
+        self._answer_by_word: dict[str, int] = {}
+        self._answer_by_cells: dict[frozenset[int], int] = {}
+        for num_answer, (word, strand) in enumerate(self._answers):
+            self._answer_by_word.setdefault(word, num_answer)
+            self._answer_by_cells.setdefault(
+                frozenset(self._board.strand_cells(strand)), num_answer)
 
         self.strands_found: list[Strand] = []
+        # which answers have been found, and the first one that
+        # has not (len(answers) once every answer is found)
+        self._answer_found: list[bool] = [False] * len(self._answers)
+        self._next_unfound = 0
+
+        # the answer owning each cell (by flat cell index, -1 if
+        # none), the order in which each answer was found (-1 if
+        # not yet), and running totals for progress displays
+        num_cells = self._board.num_rows() * self._board.num_cols()
+        self._cell_owner = array("i", [-1]) * num_cells
+        for num_answer, (_, strand) in enumerate(self._answers):
+            for index in self._board.strand_cells(strand):
+                self._cell_owner[index] = num_answer
+        self._found_order = array("i", [-1]) * len(self._answers)
+        self._num_found = 0
+        self._cells_covered = 0
+
+        self._listeners: list[Listener] = []
         self.threshold_hint = hint_threshold
         self.hint_active: None | tuple[int, bool] = None
         self.meter_hint = 0
-        self.attempted_non_strands = []
+        self.attempted_non_strands: set[str] = set()
 
     def theme(self) -> str:
         """
         Return the theme for the game.
         """
-        # debugged: strip the """ mark
-        return self.theme_line.strip().strip('"')
+        return self._spec.theme
 
     def board(self) -> Board:
         """
         Return the board for the game.
         """
-        final_board = []
-        for row in self.game_file[self.board_start:]:
-            if row.strip() == "":
-                break
-            # drop all spaces, lowercase, split into letters
-            tokens = row.split()
-            clean_row = [token.lower() for token in tokens if token.isalpha()]
-            final_board.append(clean_row)
-        return Board(final_board)
+        return self._board
     
     def answers(self) -> list[tuple[str, Strand]]:
         """
@@ -314,25 +875,64 @@ class StrandsGame(StrandsGameBase):
         stored using lowercase letters, even if the
         game file used uppercase letters.
         """
-        answer_list = []
-        for line in self.game_file[self.answers_start:]:
-            toks = line.lower().split()
-            if not toks:
-                break
-            word = toks[0]                              # theme word
-            r, c = int(toks[1]) - 1, int(toks[2]) - 1   # start position 0-based
-            steps = [Step(tok) for tok in toks[3:]]
-            strand = Strand(Pos(r, c), steps)
-            answer_list.append((word, strand))
-        return answer_list
+        return self._answers
 
     def found_strands(self) -> list[Strand]:
         return self.strands_found
 
     def game_over(self) -> bool:
-        if len(self.answers()) == len(self.strands_found):
-            return True
-        return False
+        return self._num_found == len(self._answers)
+
+    def num_found_answers(self) -> int:
+        """
+        Return the number of distinct answers found so far.
+        """
+        return self._num_found
+
+    def num_remaining_answers(self) -> int:
+        """
+        Return the number of answers not yet found.
+        """
+        return len(self._answers) - self._num_found
+
+    def num_cells_covered(self) -> int:
+        """
+        Return the number of board cells covered by
+        the answers found so far.
+        """
+        return self._cells_covered
+
+    def answer_at(self, pos: PosBase) -> int | None:
+        """
+        Return the index of the answer whose strand covers
+        a position, or None if no answer covers it.
+
+        Raises ValueError if the position is out of bounds.
+        """
+        owner = self._cell_owner[self._board._index(pos)]
+        return owner if owner >= 0 else None
+
+    def found_order_at(self, pos: PosBase) -> int | None:
+        """
+        Return the order (counting from 0) in which the answer
+        covering a position was found, or None if that answer
+        has not been found.
+
+        Raises ValueError if the position is out of bounds.
+        """
+        owner = self._cell_owner[self._board._index(pos)]
+        if owner < 0 or self._found_order[owner] < 0:
+            return None
+        return self._found_order[owner]
+
+    def reveal_answers(self) -> None:
+        """
+        Mark every answer not yet found as found, in order,
+        as if its strand had been played.
+        """
+        for num_answer, (word, strand) in enumerate(self._answers):
+            if not self._answer_found[num_answer]:
+                self._find_answer(num_answer, word, strand)
 
     def hint_threshold(self) -> int:
         return self.threshold_hint
@@ -387,54 +987,123 @@ class StrandsGame(StrandsGameBase):
         # handle each of the circumstance in the requirement
         
         # first, the "too short"
-        if len(strand.positions()) < 4:
+        if len(strand.steps) + 1 < 4:
             return 'Too short'
         #change made, delete this # before submission
-        input_strand = self.board().evaluate_strand(strand)
-        for answer in self.answers():
-            word, _ = answer
-            if word == input_strand:
-                if strand in self.strands_found:
-                    return 'Already found'
-                self.strands_found.append(strand)
-                if self.hint_active is not None:
-                    word_num, _ = self.hint_active
-                #change made, delete this # before submission
-                    if strand.start == self.answers()[word_num][1].start:
-                        self.hint_active = None
-                return (word, True)
-        strand_word = self.board().evaluate_strand(strand)
+        cells = self._board.strand_cells(strand)
+        strand_word = self._board.spell(cells)
+        answer_num = self._answer_index(strand_word, cells)
+        if answer_num is not None:
+            # any strand spelling a found theme word, not just
+            # the one that found it, has already been credited
+            if self._answer_found[answer_num]:
+                return 'Already found'
+            self._find_answer(answer_num, strand_word, strand)
+            return (strand_word, True)
         if self.try_to_find_word(strand_word):
             if strand_word in self.attempted_non_strands:
                 return 'Already found'
             else:
                 self.meter_hint += 1
-                self.attempted_non_strands.append(strand_word)
+                self.attempted_non_strands.add(strand_word)
+                self._emit(DictionaryWordFound(strand_word))
+                self._emit(HintMeterChanged(self.meter_hint,
+                                            self.threshold_hint))
                 #change made, delete this # before submission
                 return(strand_word, False)
         return 'Not a valid word'
-    
-    def try_to_find_word(self, word):
+
+    def add_listener(self, listener: Listener) -> None:
+        """
+        Register a function to be called with each event
+        (see events.py) after the game state changes.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Listener) -> None:
+        """
+        Unregister a listener added with add_listener.
+
+        Raises ValueError if the listener is not registered.
+        """
+        self._listeners.remove(listener)
+
+    def _emit(self, event: GameEvent) -> None:
+        """
+        Deliver an event to every registered listener.
+        """
+        for listener in list(self._listeners):
+            listener(event)
+
+    def _find_answer(self, answer_num: int, word: str, strand: Strand) -> None:
+        """
+        Record that strand was played to find an answer,
+        clearing the hint if it was for that answer. Does
+        nothing (and tells no listener) if the answer has
+        already been found.
+        """
+        was_over = self.game_over()
+        if not self._mark_found(answer_num):
+            return
+        self.strands_found.append(strand)
+        if self.hint_active is not None and self.hint_active[0] == answer_num:
+            self.hint_active = None
+        self._emit(ThemeWordFound(word, answer_num, strand))
+        if self.game_over() and not was_over:
+            self._emit(GameOver())
+
+    def _mark_found(self, answer_num: int) -> bool:
+        """
+        Record that an answer has been found, updating the
+        progress counters and moving the next unfound answer
+        past it (and any answers found earlier). The pointer
+        only ever moves forward, so this costs O(1) amortized
+        over the game. Returns False if the answer had
+        already been found.
+        """
+        if self._answer_found[answer_num]:
+            return False
+        self._answer_found[answer_num] = True
+        self._found_order[answer_num] = self._num_found
+        self._num_found += 1
+        self._cells_covered += len(self._answers[answer_num][1].steps) + 1
+        num_answers = len(self._answer_found)
+        while (self._next_unfound < num_answers
+               and self._answer_found[self._next_unfound]):
+            self._next_unfound += 1
+        return True
+
+    def _answer_index(self, word: str, cells: Sequence[int]) -> int | None:
+        """
+        Return the index of the answer that a strand spelling
+        word through cells finds, or None if word is not a
+        theme word. When the same word is the answer more than
+        once, the answer whose cells were traced wins.
+        """
+        answer_num = self._answer_by_word.get(word)
+        if answer_num is None:
+            return None
+        traced = self._answer_by_cells.get(frozenset(cells))
+        if traced is not None and self._answers[traced][0] == word:
+            return traced
+        return answer_num
+
+    def try_to_find_word(self, word: str) -> bool:
         #change made, delete this # before submission
         '''
         checks to see if a word is a valid dictionary word
 
-        uses the usable_words variable that stores a nested dictionary of all 
-        valid words in the assets/web2.txt file. 
+        uses the shared DICTIONARY loader, which opens the memory-mapped
+        word list compiled from assets/web2.txt on first use
+        (see src/dictionary.py).
 
         returns True
-            if the word is in the valid_words nested dictionary
+            if the word is in the word list
 
         returns False
-            if the word is not in the valid_words nested dictionary
+            if the word is not in the word list
         '''
-        first = word[0]
-        first_two = word[:2]
-        check = usable_words[first]
-        check_two = check[first_two]
-        if word in check_two:
-            return True
-        return False
+        return word in DICTIONARY.get()
 
     def use_hint(self) -> tuple[int, bool] | str:
         """
@@ -458,23 +1127,23 @@ class StrandsGame(StrandsGameBase):
             if there is already an active hint where the
             first and last letters are being displayed.
         """
-        
         if self.meter_hint >= self.threshold_hint:
             if self.hint_active is None:
-                for num_answer, answer in enumerate(self.answers()):
-                    _, strand = answer
-                    check = False
-                    #change made, delete this # before submission
-                    for found_strand in self.strands_found:
-                        if found_strand.start == strand.start:
-                            check = True
-                    if not check: 
-                        self.meter_hint -= self.threshold_hint       
-                        self.hint_active = (num_answer, False)
-                        return (num_answer, False)
+                num_answer = self._next_unfound
+                if num_answer == len(self._answers):
+                    # every answer has been found
+                    return 'No hint yet'
+                self.meter_hint -= self.threshold_hint
+                self.hint_active = (num_answer, False)
+                if self.threshold_hint:
+                    self._emit(HintMeterChanged(self.meter_hint,
+                                                self.threshold_hint))
+                self._emit(HintActivated(num_answer, False))
+                return (num_answer, False)
             answer_num, boolean = self.hint_active
             if not boolean:
                 self.hint_active = (answer_num, True)
+                self._emit(HintActivated(answer_num, True))
                 return (answer_num, True)
             if boolean:
                 return 'Use your current hint'
@@ -1,21 +1,34 @@
 import click
+import contextlib
+import cProfile
+import io
+import math
 import random
 import os
+import pstats
+import re
 import sys
-from typing import Any, cast
+import time
+import unicodedata
+from dataclasses import dataclass
+from typing import Any, Iterable, TextIO, cast
 
 from art_tui import (
     ArtTUIWrappers,
     ArtTUICat2,
     ArtTUISpecial,
     ArtTUICat4,
-    ArtTUIBase
+    ArtTUIBase,
+    ArtTUIText
                     )
 
 from strands import Pos, Strand, Board, StrandsGame, Step
+from events import GameEvent, GameOver
+from ansi import coalesce_sgr
+from keyboard import Key, KeyReader, ScriptedKeys, parse_key_script
+from dictionary import DICTIONARY
+from geometry import delta_index, step_between
 from colorama import init, Fore, Style, Back
-import tty
-import termios
 
 init(autoreset=True)
 
@@ -30,28 +43,24 @@ COLORS = [
     Fore.LIGHTMAGENTA_EX,
 ]
 
-DIRECTIONS: dict[str, tuple[tuple[int, int], str]] = {
-    "1": ((-1, -1), "NW"),
-    "2": ((-1, 0), "Up"),
-    "3": ((-1, 1), "NE"),
-    "4": ((0, -1), "Left"),
-    "6": ((0, 1), "Right"),
-    "7": ((1, -1), "SW"),
-    "8": ((1, 0), "Down"),
-    "9": ((1, 1), "SE"),
+DIRECTIONS: dict[str, tuple[Step, str]] = {
+    "1": (Step.NW, "NW"),
+    "2": (Step.N, "Up"),
+    "3": (Step.NE, "NE"),
+    "4": (Step.W, "Left"),
+    "6": (Step.E, "Right"),
+    "7": (Step.SW, "SW"),
+    "8": (Step.S, "Down"),
+    "9": (Step.SE, "SE"),
 }
 
-CONNECTIONS: dict[tuple[int, int], str] = {
-    (0, 1): "-",
-    (0, -1): "-",
-    (1, 0): "|",
-    (-1, 0): "|",
-    (1, 1): "\\",
-    (-1, -1): "\\",
-    (1, -1): "/",
-    (-1, 1): "/",
-    (0, 0): " ",
-}
+# connector glyph for each (row, col) delta, indexed by
+# geometry.delta_index
+CONNECTIONS: tuple[str, ...] = (
+    "\\", "|", "/",
+    "-", " ", "-",
+    "/", "|", "\\",
+)
 
 SUPPORTED_FRAMES: dict[str, type[ArtTUIBase]] = {
     "cat2": ArtTUICat2,
@@ -61,9 +70,84 @@ SUPPORTED_FRAMES: dict[str, type[ArtTUIBase]] = {
     "special": ArtTUISpecial,
 }
 
+# home the cursor and clear the screen, before a full differential frame
+CLEAR_SCREEN = "\033[H\033[2J"
+ANSI_ESCAPE = re.compile(r"\033\[[0-9;]*[A-Za-z]")
+
+# the hot paths summarized by --profile: drawing a frame, playing a
+# strand, and the art frame's parts
+PROFILED = re.compile(r"\((render|submit_strand|try_to_find_word|art_text"
+                      r"|print_\w+|\w+_(edge|bar)_text)\)$")
+
+
+def art_text(art: ArtTUIBase, part: str) -> str:
+    """
+    Return one part of an art frame ("top_edge", "bottom_edge", "left_bar"
+    or "right_bar") as a string. Art classes from art_tui provide these
+    ready-made; for any other art class, the output of its print method
+    is captured.
+    """
+    if isinstance(art, ArtTUIText):
+        return cast(str, getattr(art, f"{part}_text")())
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        getattr(art, f"print_{part}")()
+    return out.getvalue()
+
+
+def move_cursor(row: int, col: int) -> str:
+    """Return the escape code moving the cursor to a 0-indexed row and column."""
+    return f"\033[{row + 1};{col + 1}H"
+
+
+def display_width(text: str) -> int:
+    """Return the number of terminal columns text takes, ignoring escape codes."""
+    width = 0
+    for char in ANSI_ESCAPE.sub("", text):
+        if unicodedata.combining(char):
+            continue
+        width += 2 if unicodedata.east_asian_width(char) in "WF" else 1
+    return width
+
+
+@dataclass
+class HeadlessReport:
+    """
+    The outcome of TUIStub.run_headless: how long each key took to
+    handle (and draw), in seconds, and the frames and bytes written.
+    """
+
+    latencies: list[float]
+    frames: int
+    cells: int
+    bytes_written: int
+
+    def percentile(self, percent: float) -> float:
+        """
+        Return the latency below which the given percentage of keys
+        fall (nearest rank), or 0.0 if there were no keys.
+        """
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        rank = max(1, math.ceil(percent / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def summary(self) -> str:
+        """
+        Return a one-line summary of the run.
+        """
+        percentiles = "  ".join(
+            f"p{p}: {self.percentile(p) * 1000:.3f} ms" for p in (50, 90, 99))
+        return (f"{len(self.latencies)} keys, {self.frames} frames, "
+                f"{self.cells} cells, {self.bytes_written} bytes  "
+                f"{percentiles}  "
+                f"max: {self.percentile(100) * 1000:.3f} ms")
+
 
 class TUIStub:
-    def __init__(self, filename: str, hint_threshold: int, art_frame: str):
+    def __init__(self, filename: str, hint_threshold: int, art_frame: str,
+                 diff_render: bool = False, max_fps: float = 60):
         game_files = [f for f in os.listdir("boards")]
         if filename != "assets/special.txt" and filename[7:] not in game_files:
             print()
@@ -81,52 +165,162 @@ class TUIStub:
         self.height: int = self.board.num_rows()
         self.width: int = self.board.num_cols()
 
-        self.curr_pos: Pos = Pos(0, 0)
+        self.curr_pos: Pos = self.board.pos(0, 0)
         self.previous_pos: Pos | str = ""
-        self.hint_positions: list[Pos] = []
+        self.hint_positions: set[Pos] = set()
         self.attempting: list[Pos] = []
-        self.found_pos: dict[tuple[int, int], int] = {}
+        self.attempting_set: set[Pos] = set()
         self.action: str = "Good Luck!"
         self.strand_attempt: list[Pos | Step] = []
 
         self.game.threshold_hint = hint_threshold
         self.art = art_frame_use(self.height, (self.width * 4) - 2)
+
+        # redraw only when the game or the view has changed
+        self.dirty: bool = True
+        self.diff_render: bool = diff_render
+        self.previous_rows: list[list[str]] | None = None
+        self.frame_origin: tuple[int, int] = (0, 0)
+        self.frame_lines: int = 0
+
+        # render at most once per frame interval (0 for no limit)
+        self.frame_interval: float = 1 / max_fps if max_fps > 0 else 0
+        self.last_render: float = 0.0
+        self.won: bool = False
+        self.last_view: tuple[Any, ...] = ()
+        self.game.add_listener(self.on_game_event)
+
+        self.keys: KeyReader | ScriptedKeys = KeyReader()
+        # where frames go (None for whatever sys.stdout is at the time)
+        self.out: TextIO | None = None
+        self.running: bool = True
+        self.headless: bool = False
+        self.frames_rendered: int = 0
+        self.cells_drawn: int = 0
+        self.bytes_written: int = 0
+
+    def on_game_event(self, event: GameEvent) -> None:
+        """Note a change to the game state, to be drawn on the next render."""
+        self.dirty = True
+        if isinstance(event, GameOver):
+            self.won = True
+
+    def view_state(self) -> tuple[Any, ...]:
+        """Return the parts of the TUI's own state that render draws."""
+        return (self.curr_pos, self.action, tuple(self.attempting),
+                frozenset(self.hint_positions))
+
+    def needs_render(self) -> bool:
+        """Decide whether anything has changed since the last render."""
+        return self.dirty or self.view_state() != self.last_view
+
+    def frame_due_in(self) -> float | None:
+        """
+        Return how many seconds until the next frame should be rendered
+        (0 if it is due now), or None if nothing has changed.
+        """
+        if not self.needs_render():
+            return None
+        next_frame = self.last_render + self.frame_interval
+        return max(0.0, next_frame - time.monotonic())
+
+    def counters(self) -> str:
+        """Return the frames rendered, interior cells drawn and bytes written so far."""
+        return (f"{self.frames_rendered} frames, {self.cells_drawn} cells, "
+                f"{self.bytes_written} bytes")
     
     def render(self) -> None:
         """Print the entire board with framing and highlighting for found strands."""
+        self.dirty = False
+        self.last_view = self.view_state()
+        self.last_render = time.monotonic()
+        if self.diff_render:
+            frame = self.build_diff()
+        else:
+            frame = self.build_frame()
+        output = coalesce_sgr(frame)
+        out = self.out if self.out is not None else sys.stdout
+        out.write(output)
+        out.flush()
+        self.frames_rendered += 1
+        self.bytes_written += len(output.encode())
+
+    def build_frame(self) -> str:
+        """
+        Return the whole frame drawn by render as one string, so
+        that render can emit the frame with a single write.
+        """
+        out = io.StringIO()
+        self.draw_frame(out)
+        return out.getvalue()
+
+    def build_diff(self) -> str:
+        """
+        Return the terminal output that brings the screen from the
+        previous frame to the current one. The first frame (or one
+        whose interior changed shape) clears the screen and is drawn
+        in full; after that, only interior cells whose glyph or style
+        changed are redrawn, each at its cursor-addressed position.
+        """
+        rows = self.interior_rows()
+        previous = self.previous_rows
+        self.previous_rows = rows
+        if previous is None or [len(row) for row in previous] \
+                != [len(row) for row in rows]:
+            out = io.StringIO()
+            out.write(CLEAR_SCREEN)
+            self.draw_frame(out, rows)
+            return out.getvalue()
+
+        top, left = self.frame_origin
+        updates = []
+        for num_row, (old_row, row) in enumerate(zip(previous, rows)):
+            next_col = -1
+            for num_col, cell in enumerate(row):
+                if cell == old_row[num_col]:
+                    continue
+                # the cursor is already there after the previous cell
+                if num_col != next_col:
+                    updates.append(move_cursor(top + num_row, left + num_col))
+                updates.append(cell)
+                next_col = num_col + 1
+                self.cells_drawn += 1
+        if not updates:
+            return ""
+        updates.append(move_cursor(self.frame_lines, 0))
+        return "".join(updates)
+
+    def interior_rows(self) -> list[list[str]]:
+        """
+        Return the interior of the frame (everything between the
+        art bars) as rows of cells, one per terminal column. Each
+        cell is one character, with its style codes if it has any.
+        """
         total_width = self.width * 2 - 1 
         total_height = self.height * 2 - 1
         find_center = self.width * 4 - 2
         theme = self.game.theme()
-        self.art.print_top_edge()
-
-        self.art.print_left_bar()
-        print(theme.center(find_center), end="")
-        self.art.print_right_bar()
-
-        self.art.print_left_bar()
-        print(self.action.center(find_center), end="")
-        self.art.print_right_bar()
+        blank = [' '] * (2 * total_width)
 
-        self.art.print_left_bar()
-        print('  ' * (total_width), end="")
-        self.art.print_right_bar()
+        rows = [list(theme.center(find_center)),
+                list(self.action.center(find_center)),
+                blank]
 
         grid: list[list[str]] = \
             [[' ' for _ in range(total_width)] for _ in range(total_height)]
-
         for row in range(self.height):
             for col in range(self.width):
-                pos = Pos(row, col)
+                pos = self.board.pos(row, col)
                 letter = self.board.get_letter(pos).upper()
+                order = self.game.found_order_at(pos)
 
                 display = letter
-                if pos in self.attempting:
+                if pos in self.attempting_set:
                     display = f'{Back.GREEN}{letter}{Style.RESET_ALL}'
                 elif self.curr_pos == pos:
                     display = f'{Back.YELLOW}{letter}{Style.RESET_ALL}'
-                elif (row, col) in self.found_pos:
-                    color = COLORS[self.found_pos[(pos.r, pos.c)] - 1]
+                elif order is not None:
+                    color = COLORS[order % len(COLORS)]
                     display = f'{color}{letter}{Style.RESET_ALL}'
                 elif pos in self.hint_positions:
                     display = f'{Fore.RED}{letter}{Style.RESET_ALL}'
@@ -140,41 +334,62 @@ class TUIStub:
             connection = self.connecter_character(prev, curr)
             grid[prev.r * 2 + direction_r][prev.c * 2 + direction_c] = connection
 
-        for _, strand in enumerate(self.game.strands_found, 1):
-            positions = strand.positions()
-            for num_position in range(1, len(positions)):
-                prev = positions[num_position - 1]
-                curr = positions[num_position]
-                connection = self.connecter_character(prev, curr)
-                grid[prev.r * 2 + (curr.r - prev.r)][prev.c * 2 + (curr.c - prev.c)] = connection
-
-        for row in range(len(grid)):
-            self.art.print_left_bar()
-            for col in range(len(grid[0])):
-                print(grid[row][col], end=' ')
-            self.art.print_right_bar()
+        cols = self.width
+        for strand in self.game.strands_found:
+            cells = self.board.strand_cells(strand)
+            for prev_cell, curr_cell in zip(cells, cells[1:]):
+                prev_r, prev_c = divmod(prev_cell, cols)
+                curr_r, curr_c = divmod(curr_cell, cols)
+                connection = CONNECTIONS[delta_index(prev_r - curr_r,
+                                                     prev_c - curr_c)]
+                grid[prev_r + curr_r][prev_c + curr_c] = connection
+
+        for grid_row in grid:
+            line = []
+            for cell in grid_row:
+                line.append(cell)
+                line.append(' ')
+            rows.append(line)
 
         if self.game.hint_meter() >= self.game.threshold_hint:
             hint_display = self.game.threshold_hint
         else:
             hint_display = self.game.hint_meter()
 
-        found_str = f"Found: {len(self.game.strands_found)} / {len(self.game.answers())}"
+        found_str = f"Found: {self.game.num_found_answers()} / {len(self.game.answers())}"
         hint_str = f"Hint meter: {hint_display} / {self.game.threshold_hint}"
 
-        self.art.print_left_bar()
-        print('  ' * (total_width), end="")
-        self.art.print_right_bar()
-
-        self.art.print_left_bar()
-        print(found_str.center(find_center), end="")
-        self.art.print_right_bar()
-
-        self.art.print_left_bar()
-        print(hint_str.center(find_center), end="")
-        self.art.print_right_bar()
-
-        self.art.print_bottom_edge()
+        rows.append(blank)
+        rows.append(list(found_str.center(find_center)))
+        rows.append(list(hint_str.center(find_center)))
+        return rows
+
+    def draw_frame(self, out: io.StringIO,
+                   rows: list[list[str]] | None = None) -> None:
+        """
+        Write the frame around the interior rows (by default, the
+        current ones) to out, splicing in the art frame's edges and
+        bars. Also records where the interior starts on the screen
+        and how many lines the frame takes, for differential rendering.
+        """
+        if rows is None:
+            rows = self.interior_rows()
+        self.cells_drawn += sum(len(row) for row in rows)
+        top_edge = art_text(self.art, "top_edge")
+        bottom_edge = art_text(self.art, "bottom_edge")
+        out.write(top_edge)
+        left = 0
+        for num_row, row in enumerate(rows):
+            left_bar = art_text(self.art, "left_bar")
+            if num_row == 0:
+                left = display_width(left_bar)
+            out.write(left_bar)
+            out.write(''.join(row))
+            out.write(art_text(self.art, "right_bar"))
+        out.write(bottom_edge)
+        self.frame_origin = (top_edge.count('\n'), left)
+        self.frame_lines = (top_edge.count('\n') + len(rows)
+                            + bottom_edge.count('\n'))
 
     def check_curr_pos_valid(self, row: int, col: int) -> bool:
         if row < 0 or row > self.board.num_rows() - 1:
@@ -186,26 +401,40 @@ class TUIStub:
     def connecter_character(self, start_pos: Pos, end_pos: Pos) -> str:
         row_move = start_pos.r - end_pos.r
         col_move = start_pos.c - end_pos.c
-        return CONNECTIONS[(row_move, col_move)]
-
-    def get_single_character(self) -> str:
-        fdInput = sys.stdin.fileno()
-        termAttr = termios.tcgetattr(0)
-        tty.setraw(fdInput)
-        ch = sys.stdin.buffer.raw.read(4).decode(sys.stdin.encoding)
-        if len(ch) == 1:
-            if ord(ch) < 32 or ord(ch) > 126:
-                ch = ord(ch)
-        elif ord(ch[0]) == 27:
-            ch = "\033" + ch[1:]
-        termios.tcsetattr(fdInput, termios.TCSADRAIN, termAttr)
-        return ch
-
-    def get_input(self) -> str:
+        return CONNECTIONS[delta_index(row_move, col_move)]
+
+    def add_attempt(self, pos: Pos) -> None:
+        """Add a position to the strand being attempted."""
+        self.attempting.append(pos)
+        self.attempting_set.add(pos)
+
+    def attempt_letter(self) -> bool:
+        """
+        Add the current position to the strand being attempted,
+        returning False if it is not adjacent to the last letter.
+        """
+        if not self.attempting:
+            self.strand_attempt.append(self.curr_pos)
+        else:
+            prev = self.attempting[-1]
+            step = step_between(prev.r, prev.c, self.curr_pos.r, self.curr_pos.c)
+            if step is None:
+                return False
+            self.strand_attempt.append(step)
+        self.add_attempt(self.curr_pos)
+        return True
+
+    def clear_attempt(self) -> None:
+        """Forget the strand being attempted."""
+        self.attempting = []
+        self.attempting_set = set()
+        self.strand_attempt = []
+
+    def get_input(self) -> Key:
         '''
         Prompta an input from the player
         '''
-        return self.get_single_character()
+        return self.keys.read_key()
     
     def hint_in_use(self) -> None:
         if self.game.hint_active is None: 
@@ -215,80 +444,86 @@ class TUIStub:
             if not status:
                 self.action = 'Using a Hint'
                 hint_in_use = self.game.answers()[num_strand][1]
-                self.hint_positions.append(hint_in_use.positions()[0])
-                self.hint_positions.append(hint_in_use.positions()[-1])
+                hint_cells = self.board.strand_positions(hint_in_use)
+                self.hint_positions.add(hint_cells[0])
+                self.hint_positions.add(hint_cells[-1])
             else:
                 self.action = 'Use current hint'
 
     def run_event_loop(self) -> None:
         '''
-        checks if the input is valid and completes the action of the valid input
+        handles keys as they arrive, rendering the latest state at most
+        once per frame interval, however fast the keys come in
         '''
-        while True:
-            input = self.get_input()
-            if input == 'h':
-                self.game.use_hint()
-                self.hint_in_use()
-            if input == 'q':
+        while self.running:
+            due_in = self.frame_due_in()
+            if due_in == 0:
+                self.render()
+                continue
+            # wait for keys, but no longer than until the next frame
+            keys = self.keys.read_keys(due_in)
+            if self.keys.eof and not keys:
                 self.quit_game(0)
-                self.action = 'Ending Game'
-            if input == ' ':
-                attempt_len = len(self.strand_attempt)
-                if attempt_len == 0:
-                    self.strand_attempt.append(self.curr_pos)
-                else:
-                    self.strand_attempt.append(self.attempting[attempt_len - 1].step_to(self.curr_pos))
-                self.attempting.append(self.curr_pos)
+            for key in keys:
+                if not self.running:
+                    break
+                self.handle_key(key)
+
+    def handle_key(self, key: Key) -> None:
+        '''
+        checks if the input is valid and completes the action of the valid input
+        '''
+        if key == 'h':
+            self.game.use_hint()
+            self.hint_in_use()
+        if key == 'q':
+            self.quit_game(0)
+            self.action = 'Ending Game'
+        if key == ' ':
+            if self.attempt_letter():
                 self.action = 'Inputting Letter'
-            if input == 13:
-                try:
-                    if self.previous_pos == self.curr_pos:
-                        self.previous_pos = ''
-                        start_pos = cast(Pos, self.strand_attempt[0])
-                        steps: list[Step] = self.strand_attempt[1:]
-                        answer = self.game.submit_strand(Strand(start_pos, steps))
-                        if isinstance(answer, str):
-                            self.action = answer
-                        else:
-                            word, boolian = answer
-                            if boolian:
-                                self.action = f'{word} is a strand'
-                                num_found = len(self.game.strands_found)
-                                for pos in self.attempting:
-                                    self.found_pos[(pos.r, pos.c)] = num_found
-                            else:
-                                self.action = f'not a strand'
-                        self.attempting = []
-                        self.strand_attempt = []
+            else:
+                self.action = 'not a valid move'
+                self.clear_attempt()
+        if key == 13:
+            try:
+                if self.previous_pos == self.curr_pos:
+                    self.previous_pos = ''
+                    start_pos = cast(Pos, self.strand_attempt[0])
+                    steps: list[Step] = self.strand_attempt[1:]
+                    answer = self.game.submit_strand(Strand(start_pos, steps))
+                    if isinstance(answer, str):
+                        self.action = answer
                     else:
-                        self.previous_pos = self.curr_pos
-                        attempt_len = len(self.strand_attempt)
-                        if attempt_len == 0:
-                            self.strand_attempt.append(self.curr_pos)
+                        word, boolian = answer
+                        if boolian:
+                            self.action = f'{word} is a strand'
                         else:
-                            self.strand_attempt.append(self.attempting[attempt_len - 1].step_to(self.curr_pos))
-                        self.attempting.append(self.curr_pos)
-                        self.action = 'Inputting Letter'
-                except:
-                    self.action = 'not a valid move'
-                    self.attempting = []
-                    self.strand_attempt = []
-                if len(self.game.strands_found) == len(self.game.answers()):
-                        self.quit_game(1)
-            if input == 27:
-                self.attempting = []
-                self.previous_pos = ''
-                self.strand_attempt = []
-            if input in DIRECTIONS:
-                r_move, c_move = DIRECTIONS[input][0]
-                r_curr = self.curr_pos.r
-                c_curr = self.curr_pos.c
-                if self.check_curr_pos_valid(r_curr + r_move, c_curr + c_move):
-                    self.curr_pos = Pos(r_curr + r_move, c_curr + c_move)
-                    self.action = f'Moved {DIRECTIONS[input][1]}'
+                            self.action = f'not a strand'
+                    self.clear_attempt()
                 else:
-                    self.action = 'Invalid Move'
-            self.render()
+                    self.previous_pos = self.curr_pos
+                    if self.attempt_letter():
+                        self.action = 'Inputting Letter'
+                    else:
+                        self.action = 'not a valid move'
+                        self.clear_attempt()
+            except:
+                self.action = 'not a valid move'
+                self.clear_attempt()
+            if self.won:
+                self.quit_game(1)
+        if key == 27:
+            self.clear_attempt()
+            self.previous_pos = ''
+        if key in DIRECTIONS:
+            step, name = DIRECTIONS[key]
+            new_pos = self.board.neighbor(self.curr_pos, step)
+            if new_pos is not None:
+                self.curr_pos = new_pos
+                self.action = f'Moved {name}'
+            else:
+                self.action = 'Invalid Move'
 
     def quit_game(self, code: int) -> None:
         if code == 0:
@@ -297,23 +532,43 @@ class TUIStub:
             self.action = 'You Win!!!'
         self.curr_pos = ''
         self.render()
-        sys.exit()
+        self.running = False
+        if not self.headless:
+            sys.exit()
 
     def run(self) -> None:
+        DICTIONARY.warm()
+        with self.keys:
+            self.render()
+            self.run_event_loop()
+    
+    def run_headless(self, keys: Iterable[Key]) -> "HeadlessReport":
+        """
+        Play a sequence of keys through the event loop with no terminal:
+        frames go to an in-memory sink (self.out), every change is drawn
+        at once, and the game stops at the end of the keys (or on q).
+        """
+        self.headless = True
+        self.out = io.StringIO()
+        self.frame_interval = 0
+        script = ScriptedKeys(keys)
+        self.keys = script
+        DICTIONARY.get()
         self.render()
         self.run_event_loop()
-    
+        script.finish()
+        return HeadlessReport(script.latencies, self.frames_rendered,
+                              self.cells_drawn, self.bytes_written)
+
     def show_board(self) -> None:
-        for num_answer, answer in enumerate(self.game.answers()):
-            for position in answer[1].positions():
-                self.found_pos[(position.r, position.c)] = num_answer
-            self.game.strands_found.append(answer[1])
+        self.game.reveal_answers()
         self.curr_pos = ''
         self.render()
 
     def run_title_screen(self) -> None:
-        self.title_screen()
-        self.title_screen_event_loop()
+        with self.keys:
+            self.title_screen()
+            self.title_screen_event_loop()
     
     def title_screen(self) -> None:
         total_width = self.width * 2 - 1 
@@ -366,12 +621,24 @@ class TUIStub:
         checks if the input is valid and completes the action of the valid input
         '''
         while True:
-            input = self.get_input()
-            if input == 13:
+            key = self.get_input()
+            if key == 13:
                 self.run()
-            if input == 'q':
+            if key == 'q':
                 self.quit_game(0)
 
+def print_profile(profiler: cProfile.Profile, filename: str, tui: TUIStub) -> None:
+    """
+    Dump the profiler's stats to filename (for pstats or snakeviz), then
+    print the time spent in the PROFILED hot paths and the TUI's counters.
+    """
+    profiler.dump_stats(filename)
+    stats = pstats.Stats(filename)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE)
+    stats.print_stats(PROFILED.pattern)
+    print(tui.counters())
+    print(f"Profile written to {filename}")
+
 @click.command()
 @click.option('--show', is_flag=True, help="Only shows board answers")
 @click.option('-g', '--game', help="Which game file to load")
@@ -379,7 +646,11 @@ class TUIStub:
 @click.option('-a', '--art', 'art_frame', default='stub', help="Art frame to use.")
 @click.option('--title_screen', is_flag=True, help="Displays a title screen.")
 @click.option('--special', is_flag=True, help="Plays special made board.")
-def main(show: str, game: str, hint_threshold: int, art_frame: str, title_screen: str, special: str) -> None:
+@click.option('--diff', 'diff_render', is_flag=True, help="Only redraw cells that changed.")
+@click.option('--fps', 'max_fps', default=60.0, help="Most frames to draw per second (0 for no limit).")
+@click.option('--script', type=click.File(), help="Play the keys in this file headless and report timings.")
+@click.option('--profile', type=click.Path(dir_okay=False, writable=True), help="Profile the run, dumping cProfile stats to this file and printing a summary.")
+def main(show: str, game: str, hint_threshold: int, art_frame: str, title_screen: str, special: str, diff_render: bool, max_fps: float, script: TextIO | None, profile: str | None) -> None:
 
     if game is None:
         game_files = [f[:-4] for f in os.listdir('boards')]
@@ -391,15 +662,26 @@ def main(show: str, game: str, hint_threshold: int, art_frame: str, title_screen
     else:
         filename = f'boards/{game}.txt'
 
-    tui = TUIStub(filename, hint_threshold, art_frame)
-
-
-    if show:
-        tui.show_board()
-    elif title_screen:
-        tui.run_title_screen()
-    else:
-        tui.run()
+    tui = TUIStub(filename, hint_threshold, art_frame, diff_render, max_fps)
+
+    profiler = cProfile.Profile() if profile is not None else None
+    if profiler is not None:
+        profiler.enable()
+    try:
+        if script is not None:
+            report = tui.run_headless(parse_key_script(script.read()))
+            print(report.summary())
+        elif show:
+            tui.show_board()
+        elif title_screen:
+            tui.run_title_screen()
+        else:
+            tui.run()
+    finally:
+        # quit_game leaves through sys.exit, so report on the way out
+        if profiler is not None and profile is not None:
+            profiler.disable()
+            print_profile(profiler, profile, tui)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
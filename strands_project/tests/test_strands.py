@@ -3,10 +3,25 @@ Tests for Milestone 1 Game Logic
 """
 
 import pytest
+import io
+import re
 import os
-
-from strands import Pos, Strand, Board, StrandsGame
+import subprocess
+import sys
+import pickle
+import threading
+import strands
+from itertools import permutations
+
+from strands import (Pos, Strand, Board, StrandsGame, GameSpec, load_game_spec,
+                     solve, are_folded)
 from base import PosBase, StrandBase, BoardBase, StrandsGameBase, Step
+from dictionary import WordList, DictionaryLoader, ROOT, NO_NODE
+from ansi import coalesce_sgr
+from solve_catalog import solve_game_file, game_files
+from keyboard import split_keys, parse_key_script, ScriptedKeys
+from events import (ThemeWordFound, DictionaryWordFound, HintMeterChanged,
+                    HintActivated, GameOver)
 
 # 0
 def test_inheritance():
@@ -882,4 +897,852 @@ def test_play_game_counter_offers_hints_1():
         result = game.submit_strand(strand)
         assert result == (word, True)
 
-    assert len(game.found_strands()) == 4
\ No newline at end of file
+    assert len(game.found_strands()) == 4
+
+
+"""
+Compiled dictionary
+"""
+# 28
+def test_word_list_lookup():
+    """
+    Check that the compiled word list agrees with web2.txt:
+    words of four or more letters are found (with their
+    original capitalization), shorter words are not.
+    """
+    words = WordList.open()
+    for word in ["bacon", "toast", "zythum", "Aaron"]:
+        assert word in words
+    for word in ["cat", "aaron", "xxxx", "toastx", ""]:
+        assert word not in words
+    # sorted order is preserved
+    assert words.word(0) < words.word(1) < words.word(len(words) - 1)
+
+
+# 29
+def test_word_list_rebuilds_when_source_changes(tmp_path):
+    """
+    Check that a stale compiled file is rebuilt when the
+    source word list changes.
+    """
+    source = tmp_path / "words.txt"
+    target = tmp_path / "words.dict"
+    source.write_text("apple\nbanana\nfig\n")
+
+    words = WordList.open(str(source), str(target))
+    assert len(words) == 2
+    assert "apple" in words and "fig" not in words
+
+    source.write_text("apple\ncherry\n")
+    words = WordList.open(str(source), str(target))
+    assert len(words) == 2
+    assert "cherry" in words and "banana" not in words
+
+
+# 30
+def test_import_does_not_load_dictionary():
+    """
+    Check, in a fresh interpreter, that importing strands and
+    loading a game does not open the word list (or import NumPy),
+    and that the first dictionary lookup does.
+    """
+    code = (
+        "import sys\n"
+        "import strands\n"
+        "game = strands.StrandsGame('boards/a-good-roast.txt')\n"
+        "assert 'numpy' not in sys.modules\n"
+        "print(strands.DICTIONARY.is_loaded())\n"
+        "game.try_to_find_word('bacon')\n"
+        "print(strands.DICTIONARY.is_loaded())\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code],
+                            env={"PYTHONPATH": "src"},
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.split() == ["False", "True"]
+
+
+# 31
+def test_dictionary_loader_loads_once(tmp_path):
+    """
+    Check that concurrent calls to DictionaryLoader.get()
+    all receive the same WordList.
+    """
+    source = tmp_path / "words.txt"
+    source.write_text("apple\nbanana\n")
+    loader = DictionaryLoader(str(source), str(tmp_path / "words.dict"))
+    assert not loader.is_loaded()
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(loader.get()))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loader.is_loaded()
+    assert len(results) == 8
+    assert all(words is results[0] for words in results)
+    assert "banana" in loader.get()
+
+    loader.warm().join()
+    assert loader.get() is results[0]
+
+
+# 32
+def test_word_list_prefix_queries():
+    """
+    Check exact lookup, has_prefix and iter_prefix on the
+    trie, including walking it one letter at a time.
+    """
+    words = WordList.open()
+    assert words.has_prefix("baco")
+    assert words.has_prefix("bacon")
+    assert not words.has_prefix("bqz")
+    assert "baco" not in words
+
+    assert list(words.iter_prefix("bacon")) == \
+        ["bacon", "baconer", "baconize", "baconweed", "bacony"]
+    assert list(words.iter_prefix("bqz")) == []
+
+    node = ROOT
+    for letter in "toas":
+        node = words.child(node, letter)
+        assert node != NO_NODE
+        assert not words.is_word_node(node)
+    node = words.child(node, "t")
+    assert words.is_word_node(node)
+    assert node == words.find_node("toast")
+    assert words.child(node, "q") == NO_NODE
+
+
+"""
+Board solver
+"""
+# 33
+def test_solve_small_board():
+    """
+    On a 2x2 board every cell neighbors every other cell, so
+    the solver must find exactly the dictionary words that are
+    arrangements of all four letters, with one strand for each
+    arrangement.
+    """
+    board = Board([["t", "o"], ["s", "a"]])
+    words = WordList.open()
+    expected = sorted({"".join(p) for p in permutations("tosa")
+                       if "".join(p) in words})
+    solutions = solve(board)
+    assert sorted(solutions) == expected
+    for word, strands in solutions.items():
+        assert len(strands) == 1
+        assert board.evaluate_strand(strands[0]) == word
+
+
+# 34
+def test_solve_a_good_roast():
+    """
+    Check that every strand the solver returns spells its word,
+    is not cyclic and stays on the board, and that theme words
+    in the dictionary are found along their answer strands.
+    """
+    game = StrandsGame("boards/a-good-roast.txt")
+    board = game.board()
+    solutions = solve(board)
+    for word, strands in solutions.items():
+        assert len(word) >= 4
+        assert game.try_to_find_word(word)
+        for strand in strands:
+            assert board.evaluate_strand(strand) == word
+            assert not strand.is_cyclic()
+    for word, strand in game.answers():
+        if len(word) >= 4 and game.try_to_find_word(word):
+            assert strand in solutions[word]
+
+
+"""
+Answer coverage
+"""
+# 35
+def test_load_game_answers_must_fill_board():
+    """
+    Check that game files whose answers overlap, or leave
+    cells of the board uncovered, raise ValueError naming
+    the offending cells.
+    """
+    board = ["Tiny\n", "\n", "A B C\n", "D E F\n", "\n"]
+
+    with pytest.raises(ValueError, match=r"\(2, 1\), \(2, 2\), \(2, 3\)"):
+        StrandsGame(board + ["ABC 1 1 e e\n"])
+
+    with pytest.raises(ValueError, match=r"overlap at \(1, 3\)"):
+        StrandsGame(board + ["ABC 1 1 e e\n", "CFED 1 3 s w w\n"])
+
+    game = StrandsGame(board + ["ABC 1 1 e e\n", "FED 2 3 w w\n"])
+    assert [word for word, _ in game.answers()] == ["abc", "fed"]
+
+
+"""
+Game spec cache
+"""
+# 36
+def test_game_spec_is_built_once():
+    """
+    Check that loading the same game twice (from a file or
+    from its lines) reuses one immutable GameSpec, and that
+    board() and answers() do not rebuild anything.
+    """
+    first = StrandsGame("boards/fore.txt")
+    second = StrandsGame("boards/fore.txt")
+    with open("boards/fore.txt") as f:
+        third = StrandsGame(f.readlines())
+
+    spec = load_game_spec("boards/fore.txt")
+    assert isinstance(spec, GameSpec)
+    assert first.board() is spec.board is second.board() is third.board()
+    assert first.board() is first.board()
+    assert first.answers() is first.answers()
+    assert first.answers() == list(spec.answers)
+    assert first.theme() == spec.theme == "Fore!"
+
+    with pytest.raises(AttributeError):
+        spec.theme = "Golf"
+
+
+# 37
+def test_game_spec_disk_cache(tmp_path):
+    """
+    Check that specs are pickled into the cache directory,
+    keyed by the content hash of the game file.
+    """
+    # a variation not yet cached in-process
+    with open("boards/a-good-roast.txt") as f:
+        lines = f.readlines() + ["\n", "disk cache test\n"]
+    spec = load_game_spec(lines, str(tmp_path))
+    cached = list(tmp_path.glob("*.pickle"))
+    assert len(cached) == 1
+
+    with open(cached[0], "rb") as f:
+        restored = pickle.load(f)
+    assert restored.theme == spec.theme
+    assert [w for w, _ in restored.answers] == [w for w, _ in spec.answers]
+    assert restored.answers[0][1] == spec.answers[0][1]
+
+
+"""
+Submission indexes
+"""
+# 38
+def test_submit_strand_repeats():
+    """
+    Check that theme words and dictionary words are each
+    only credited once, including on a board where the same
+    theme word is the answer twice, and when a found theme
+    word is traced again along a different path.
+    """
+    game = StrandsGame("boards/a-good-roast.txt")
+    theme_words = {word for word, _ in game.answers()}
+    word, strands = next((w, s) for w, s in solve(game.board()).items()
+                         if w not in theme_words)
+    assert game.submit_strand(strands[0]) == (word, False)
+    assert game.hint_meter() == 1
+    assert game.submit_strand(strands[0]) == "Already found"
+    assert game.hint_meter() == 1
+
+    lines = ["Twice\n", "\n", "A B C D\n", "D C B A\n", "\n",
+             "ABCD 1 1 e e e\n", "ABCD 2 4 w w w\n"]
+    game = StrandsGame(lines)
+    for word, strand in reversed(game.answers()):
+        assert game.submit_strand(strand) == (word, True)
+        assert game.submit_strand(strand) == "Already found"
+    assert game.game_over()
+
+    lines = ["Palindrome\n", "\n", "A B\n", "B A\n", "\n",
+             "ABBA 1 1 e sw e\n"]
+    game = StrandsGame(lines)
+    assert game.submit_strand(game.answers()[0][1]) == ("abba", True)
+    other = Strand(Pos(0, 0), [Step("s"), Step("ne"), Step("s")])
+    assert game.submit_strand(other) == "Already found"
+    assert len(game.found_strands()) == 1
+
+
+"""
+Hashable positions and strands
+"""
+# 39
+def test_pos_and_strand_are_hashable_values():
+    """
+    Check that equal positions and strands hash equally,
+    work as set members and dict keys, and cannot be modified.
+    """
+    assert Pos(2, 3) == Pos(2, 3) and hash(Pos(2, 3)) == hash(Pos(2, 3))
+    assert {Pos(2, 3), Pos(2, 3), Pos(3, 2)} == {Pos(3, 2), Pos(2, 3)}
+    assert {Pos(1, 1): "a"}[Pos(1, 1)] == "a"
+
+    steps = [Step("e"), Step("s")]
+    strand = Strand(Pos(0, 0), steps)
+    # the strand keeps its own copy of the steps
+    steps.append(Step("w"))
+    assert strand == Strand(Pos(0, 0), [Step("e"), Step("s")])
+    assert strand in {Strand(Pos(0, 0), [Step("e"), Step("s")])}
+    assert strand != Strand(Pos(0, 0), [Step("s"), Step("e")])
+    # and hands out copies of them
+    strand.steps.append(Step("w"))
+    assert strand.steps == [Step("e"), Step("s")]
+    assert strand.positions() == [Pos(0, 0), Pos(0, 1), Pos(1, 1)]
+
+    with pytest.raises(AttributeError):
+        Pos(0, 0).r = 1
+    with pytest.raises(AttributeError):
+        strand.start = Pos(1, 1)
+    with pytest.raises(AttributeError):
+        strand.steps = []
+    assert pickle.loads(pickle.dumps(strand)) == strand
+
+
+# 40
+def test_board_interned_positions():
+    """
+    Check that a board hands out exactly one Pos per cell,
+    that steps are looked up in its neighbor table (which it
+    shares with the solver, along with its letters), and that
+    strands leaving the board are still rejected.
+    """
+    board = StrandsGame("boards/fore.txt").board()
+    assert board.pos(2, 3) is board.pos(2, 3)
+    assert board.pos(2, 3) == Pos(2, 3)
+    assert board.neighbor(Pos(2, 3), Step("ne")) is board.pos(1, 4)
+    assert board.neighbor(board.pos(0, 0), Step("n")) is None
+    assert board.flat_letters()[2 * 6 + 3] == board.get_letter(Pos(2, 3))
+    neighbors = [board.neighbor(board.pos(2, 0), step) for step in Step]
+    assert board.step_table()[2 * 6] == \
+        tuple(-1 if p is None else p.r * 6 + p.c for p in neighbors)
+
+    strand = Strand(Pos(7, 0), [Step("e"), Step("n"), Step("ne")])
+    positions = board.strand_positions(strand)
+    assert positions == strand.positions()
+    assert all(p is board.pos(p.r, p.c) for p in positions)
+    assert board.evaluate_strand(strand) == "putf"
+
+    with pytest.raises(ValueError):
+        board.pos(8, 0)
+    with pytest.raises(ValueError):
+        board.evaluate_strand(Strand(Pos(7, 5), [Step("e")]))
+
+
+"""
+Step geometry
+"""
+# 41
+def test_pos_is_adjacent_to():
+    """
+    Check is_adjacent_to for all eight neighbors, the position
+    itself, and positions two or more steps away, and that
+    step_to and take_step agree.
+    """
+    p = Pos(3, 3)
+    for step in Step:
+        neighbor = p.take_step(step)
+        assert p.is_adjacent_to(neighbor)
+        assert p.step_to(neighbor) == step
+        assert neighbor.step_to(p) != step
+    assert not p.is_adjacent_to(Pos(3, 3))
+    for far in [Pos(3, 5), Pos(1, 1), Pos(6, 6), Pos(-3, 3)]:
+        assert not p.is_adjacent_to(far)
+    with pytest.raises(ValueError):
+        p.step_to(Pos(3, 3))
+
+
+# 42
+def test_are_folded():
+    """
+    Check is_folded and are_folded on a strand that crosses
+    itself, one that only touches itself, one that loops back
+    over its first edge, and a long zig-zag that never crosses.
+    """
+    crossing = Strand(Pos(0, 0), [Step("se"), Step("n"), Step("sw")])
+    touching = Strand(Pos(0, 0), [Step("e"), Step("s"), Step("w"), Step("s")])
+    retraced = Strand(Pos(0, 0), [Step("e"), Step("s"), Step("w"),
+                                  Step("n"), Step("e")])
+    zigzag = Strand(Pos(0, 0), [Step("se"), Step("ne")] * 200)
+
+    assert crossing.is_folded()
+    assert not touching.is_folded()
+    assert retraced.is_folded()
+    assert not zigzag.is_folded()
+    assert are_folded([crossing, touching, retraced, zigzag]) == \
+        [True, False, True, False]
+    assert are_folded([]) == []
+
+
+# 43
+def test_strand_cells():
+    """
+    Check that a strand's flat cell indices match its positions,
+    are computed once per board shape and shared with the board,
+    and that positions outside the board raise ValueError.
+    """
+    strand = Strand(Pos(7, 0), [Step("e"), Step("n"), Step("ne")])
+    assert list(strand.cells(8, 6)) == [42, 43, 37, 32]
+    assert strand.cells(8, 6) is strand.cells(8, 6)
+    assert list(strand.cells(9, 4)) == [28, 29, 25, 22]
+    assert strand.positions() == [Pos(7, 0), Pos(7, 1), Pos(6, 1), Pos(5, 2)]
+    assert strand.positions() is not strand.positions()
+
+    board = StrandsGame("boards/fore.txt").board()
+    assert board.strand_cells(strand) is strand.cells(8, 6)
+    assert board.spell(board.strand_cells(strand)) == "putf"
+
+    with pytest.raises(ValueError):
+        strand.cells(7, 6)
+    with pytest.raises(ValueError):
+        Strand(Pos(0, 5), [Step("e")]).cells(8, 6)
+
+
+"""
+Batch evaluation
+"""
+# 44
+def test_evaluate_strands(monkeypatch):
+    """
+    Check that evaluate_strands spells every strand found by the
+    solver exactly as evaluate_strand does, both with and without
+    NumPy, and that a strand leaving the board raises ValueError.
+    """
+    board = StrandsGame("boards/fore.txt").board()
+    batch = [strand for found in solve(board).values() for strand in found]
+    batch.append(Strand(Pos(3, 3), []))
+    expected = [board.evaluate_strand(strand) for strand in batch]
+    assert board.evaluate_strands(batch) == expected
+    assert board.evaluate_strands([]) == []
+
+    off_board = batch[:5] + [Strand(Pos(7, 4), [Step("w"), Step("se")])]
+    with pytest.raises(ValueError):
+        board.evaluate_strands(off_board)
+
+    letters = [[board.get_letter(Pos(r, c)) for c in range(board.num_cols())]
+               for r in range(board.num_rows())]
+    monkeypatch.setattr(strands, "_numpy", lambda: None)
+    plain = Board(letters)
+    assert plain.letter_codes() is None
+    assert plain.evaluate_strands(batch) == expected
+    with pytest.raises(ValueError):
+        plain.evaluate_strands(off_board)
+
+
+"""
+Hint engine
+"""
+# 45
+def test_hints_follow_unfound_answers():
+    """
+    Find answers out of order and check that each hint goes to
+    the first answer not yet found, that finding a different
+    answer leaves the active hint alone, that finding the hinted
+    answer clears it, and that no hint is given once every
+    answer has been found.
+    """
+    game = StrandsGame("boards/fore.txt", hint_threshold=0)
+    answers = game.answers()
+
+    assert game.submit_strand(answers[0][1]) == (answers[0][0], True)
+    assert game.submit_strand(answers[2][1]) == (answers[2][0], True)
+    assert game.use_hint() == (1, False)
+
+    assert game.submit_strand(answers[3][1]) == (answers[3][0], True)
+    assert game.active_hint() == (1, False)
+    assert game.submit_strand(answers[1][1]) == (answers[1][0], True)
+    assert game.active_hint() is None
+
+    assert game.use_hint() == (4, False)
+    assert game.use_hint() == (4, True)
+    for word, strand in answers[4:]:
+        assert game.submit_strand(strand) == (word, True)
+    assert game.game_over()
+    assert game.active_hint() is None
+    assert game.use_hint() == "No hint yet"
+
+
+"""
+Progress queries
+"""
+# 46
+def test_cell_ownership_and_progress():
+    """
+    Check which answer owns each cell, the order in which answers
+    are found, and the found, remaining and covered counters, both
+    while playing and after revealing the rest of the answers.
+    """
+    game = StrandsGame("boards/fore.txt")
+    board = game.board()
+    answers = game.answers()
+    for num_answer, (_, strand) in enumerate(answers):
+        for pos in strand.positions():
+            assert game.answer_at(pos) == num_answer
+            assert game.found_order_at(pos) is None
+    assert game.num_found_answers() == 0
+    assert game.num_remaining_answers() == len(answers)
+    assert game.num_cells_covered() == 0
+
+    word, strand = answers[3]
+    assert game.submit_strand(strand) == (word, True)
+    assert game.submit_strand(strand) == "Already found"
+    assert game.found_order_at(strand.start) == 0
+    assert game.found_order_at(answers[0][1].start) is None
+    assert game.num_found_answers() == 1
+    assert game.num_remaining_answers() == len(answers) - 1
+    assert game.num_cells_covered() == len(word)
+    assert not game.game_over()
+
+    game.reveal_answers()
+    assert game.game_over()
+    assert game.num_remaining_answers() == 0
+    assert game.num_cells_covered() == board.num_rows() * board.num_cols()
+    assert game.found_order_at(answers[0][1].start) == 1
+    assert game.found_order_at(answers[4][1].start) == 4
+    assert len(game.found_strands()) == len(answers)
+    with pytest.raises(ValueError):
+        game.answer_at(Pos(8, 0))
+
+
+"""
+Game events
+"""
+# 47
+def test_game_events():
+    """
+    Register a listener, play a dictionary word, a hint and every
+    theme word, and check the events delivered; repeats (even along
+    another path) and invalid strands deliver nothing, and a removed
+    listener hears nothing.
+    """
+    game = StrandsGame("boards/fore.txt", hint_threshold=1)
+    events = []
+    game.add_listener(events.append)
+
+    # "bird", a dictionary word but not a theme word
+    bird = Strand(Pos(1, 2), [Step("nw"), Step("w"), Step("s")])
+    assert game.submit_strand(bird) == ("bird", False)
+    assert events == [DictionaryWordFound("bird"), HintMeterChanged(1, 1)]
+    events.clear()
+
+    assert game.submit_strand(bird) == "Already found"
+    assert game.submit_strand(Strand(Pos(0, 0), [Step("e")])) == "Too short"
+    assert events == []
+
+    assert game.use_hint() == (0, False)
+    game.meter_hint = 1
+    assert game.use_hint() == (0, True)
+    assert events == [HintMeterChanged(0, 1), HintActivated(0, False),
+                      HintActivated(0, True)]
+    events.clear()
+
+    answers = game.answers()
+    for num_answer, (word, strand) in enumerate(answers[:-1]):
+        game.submit_strand(strand)
+        assert events == [ThemeWordFound(word, num_answer, strand)]
+        events.clear()
+    word, strand = answers[-1]
+    game.submit_strand(strand)
+    assert events == [ThemeWordFound(word, len(answers) - 1, strand),
+                      GameOver()]
+
+    game.remove_listener(events.append)
+    events.clear()
+    game.submit_strand(strand)
+    assert events == []
+    with pytest.raises(ValueError):
+        game.remove_listener(events.append)
+
+    lines = ["Palindrome\n", "\n", "A B\n", "B A\n", "\n",
+             "ABBA 1 1 e sw e\n"]
+    game = StrandsGame(lines)
+    game.add_listener(events.append)
+    strand = game.answers()[0][1]
+    game.submit_strand(strand)
+    assert events == [ThemeWordFound("abba", 0, strand), GameOver()]
+    events.clear()
+    game.submit_strand(Strand(Pos(0, 0), [Step("s"), Step("ne"), Step("s")]))
+    game.reveal_answers()
+    assert events == []
+
+
+"""
+Terminal output
+"""
+# 48
+def test_coalesce_sgr():
+    """
+    Check that runs of cells with the same style share one SGR
+    sequence, that switching colors or dropping one needs no
+    more than one sequence, that the style is reset before each
+    newline and at the end, and that cursor moves pass through.
+    """
+    green, red, reset = "\033[42m", "\033[31m", "\033[0m"
+    assert coalesce_sgr(f"{green}A{reset}{green}B{reset}C") == \
+        f"{green}AB{reset}C"
+    assert coalesce_sgr(f"{green}  {reset}{red}x{reset}") == \
+        f"{green}  \033[0;31mx{reset}"
+    assert coalesce_sgr(f"\033[1;31mA\033[22mB{reset}") == \
+        f"\033[1;31mA\033[0;31mB{reset}"
+    assert coalesce_sgr(f"{red}A{reset}\033[34mB{reset}") == \
+        f"{red}A\033[34mB{reset}"
+    assert coalesce_sgr(f"\033[48;5;245mA\nB{reset}") == \
+        f"\033[48;5;245mA{reset}\n\033[48;5;245mB{reset}"
+    assert coalesce_sgr(f"\033[3;5H{green}A{reset}\033[9;1H") == \
+        f"\033[3;5H{green}A\033[9;1H{reset}"
+    assert coalesce_sgr(f"plain{reset}{reset}") == "plain"
+
+
+# 49
+def test_split_keys():
+    """
+    Check that a burst of input read in one go is split into
+    separate keys: printable characters, control characters as
+    integers, and whole escape sequences; and that an escape
+    sequence cut off at the end is held back until final.
+    """
+    assert split_keys("66 \r") == (["6", "6", " ", 13], "")
+    assert split_keys("\033[A8\033OB\033") == \
+        (["\033[A", "8", "\033OB", 27], "")
+    assert split_keys("\033\033[1;5C") == ([27, "\033[1;5C"], "")
+    assert split_keys("h\033[1;", final=False) == (["h"], "\033[1;")
+    assert split_keys("h\033", final=False) == (["h"], "\033")
+    assert split_keys("\033[1;") == ([27, "[", "1", ";"], "")
+    assert split_keys("\033x") == ([27, "x"], "")
+
+
+# 50
+def test_scripted_keys():
+    """
+    Check that a key script is parsed into key events (names,
+    comments and single characters), that an unknown key is
+    rejected, and that ScriptedKeys hands out one key per read,
+    timing each, until it runs out.
+    """
+    script = "# walk right\n6 6 space\nEnter ESC h\n"
+    assert parse_key_script(script) == ["6", "6", " ", 13, 27, "h"]
+    with pytest.raises(ValueError):
+        parse_key_script("6 left")
+
+    keys = ScriptedKeys(["6", 13])
+    with keys:
+        assert keys.read_keys(0.5) == ["6"]
+        assert keys.read_key() == 13
+        assert keys.read_keys() == []
+        assert keys.eof
+        with pytest.raises(EOFError):
+            keys.read_key()
+    assert len(keys.latencies) == 2
+    assert all(latency >= 0 for latency in keys.latencies)
+
+
+"""
+Headless TUI
+"""
+def import_tui():
+    """
+    Return the tui module, skipping the calling test where it
+    cannot be imported (it needs Python 3.12, colorama and pygame).
+    """
+    try:
+        import tui
+    except (ImportError, SyntaxError) as error:
+        pytest.skip(f"tui cannot be imported: {error}")
+    return tui
+
+
+# 51
+def test_run_headless():
+    """
+    Check that a headless run draws the first frame, one frame per
+    key that changes something and one on exit, and reports every
+    frame, cell and byte it wrote, with one latency per key.
+    """
+    tui = import_tui()
+    stub = tui.TUIStub("boards/fore.txt", 3, "stub")
+    report = stub.run_headless(["6", "6", "z"])
+    assert stub.action == "Exiting Strands..."
+    assert report.frames == 4
+    assert len(report.latencies) == 3
+    assert report.bytes_written == len(stub.out.getvalue().encode())
+    assert report.cells == 4 * sum(len(row) for row in stub.interior_rows())
+
+
+# 52
+def test_diff_render_cursor_move():
+    """
+    Check that, once the action line has settled, a differential
+    render after a cursor move redraws exactly the two cells whose
+    highlight changed, then parks the cursor below the frame.
+    """
+    tui = import_tui()
+    stub = tui.TUIStub("boards/fore.txt", 3, "stub", diff_render=True)
+    stub.out = io.StringIO()
+    stub.render()
+    assert stub.out.getvalue().startswith(tui.CLEAR_SCREEN)
+    stub.handle_key("6")
+    stub.render()
+
+    cells = stub.cells_drawn
+    stub.handle_key("6")
+    top, left = stub.frame_origin
+    assert stub.build_diff() == (
+        tui.move_cursor(top + 3, left + 4) + "I"
+        + tui.move_cursor(top + 3, left + 8)
+        + f"{tui.Back.YELLOW}S{tui.Style.RESET_ALL}"
+        + tui.move_cursor(stub.frame_lines, 0))
+    assert stub.cells_drawn == cells + 2
+    assert stub.build_diff() == ""
+
+
+"""
+Catalog solver
+"""
+# 53
+def test_solve_catalog(tmp_path):
+    """
+    Check that game_files lists only the .txt files in each
+    directory, in sorted order, and that solve_game_file
+    summarizes a board's solution, or reports an invalid one.
+    """
+    (tmp_path / "b.txt").write_text("Broken\n\nA B\nC\n")
+    (tmp_path / "a.txt").write_text("")
+    (tmp_path / "notes.md").write_text("")
+    assert game_files([str(tmp_path)]) == \
+        [str(tmp_path / "a.txt"), str(tmp_path / "b.txt")]
+    assert "boards/fore.txt" in game_files(["boards"])
+
+    result = solve_game_file("boards/fore.txt")
+    assert result["theme"] == "Fore!"
+    assert result["theme_words"] == 8
+    # every theme word but "golfclubs" is in the dictionary
+    assert result["theme_words_found"] == 7
+    assert result["strands"] >= result["words"] > 0
+    assert result["solve_ms"] >= 0
+
+    broken = solve_game_file(str(tmp_path / "b.txt"))
+    assert broken["board"] == str(tmp_path / "b.txt")
+    assert "error" in broken
+
+
+# 54
+def test_view_state_tracks_attempt_path():
+    """
+    Check that a burst of keys that retraces the attempt along a
+    different path of the same length, ending with the cursor and
+    message unchanged, still needs a new frame, and that the frame
+    shows the new path.
+    """
+    tui = import_tui()
+    stub = tui.TUIStub("boards/fore.txt", 3, "stub")
+    stub.out = io.StringIO()
+    for key in [" ", "6", " "]:
+        stub.handle_key(key)
+    stub.render()
+    assert stub.attempting == [Pos(0, 0), Pos(0, 1)]
+    assert f"{tui.Back.GREEN}R" in stub.out.getvalue()
+    assert stub.frame_due_in() is None
+
+    for key in [27, "8", " ", "2", " "]:
+        stub.handle_key(key)
+    assert stub.attempting == [Pos(1, 1), Pos(0, 1)]
+    assert stub.needs_render()
+    drawn = len(stub.out.getvalue())
+    stub.render()
+    lines = stub.out.getvalue()[drawn:].splitlines()
+    # (0, 0) is R, and (1, 1) is V
+    assert not any(f"{tui.Back.GREEN}R" in line for line in lines)
+    assert any(f"{tui.Back.GREEN}V" in line for line in lines)
+    assert stub.frame_due_in() is None
+
+
+class TimedKeys:
+    """
+    A stand-in for KeyReader whose keys arrive at given times on
+    a fake clock. Each read returns the next key if it arrives
+    before the timeout (moving the clock to its arrival), and
+    otherwise moves the clock to the timeout and returns nothing.
+    """
+
+    def __init__(self, arrivals):
+        """
+        Constructor
+        """
+        self.now = 0.0
+        self.arrivals = list(arrivals)
+        self.timeouts = []
+        self.eof = False
+
+    def monotonic(self):
+        return self.now
+
+    def read_keys(self, timeout=None):
+        self.timeouts.append(timeout)
+        deadline = float("inf") if timeout is None else self.now + timeout
+        if self.arrivals and self.arrivals[0][0] <= deadline:
+            arrival, key = self.arrivals.pop(0)
+            self.now = max(self.now, arrival)
+            return [key]
+        if timeout is None:
+            self.eof = True
+        else:
+            self.now = deadline
+        return []
+
+
+# 55
+def test_frame_rate_cap(monkeypatch):
+    """
+    Check that keys arriving within one frame interval are drawn
+    together in a single frame, at the end of the interval, showing
+    the latest state, and that the loop waits without a timeout
+    whenever nothing has changed.
+    """
+    tui = import_tui()
+    stub = tui.TUIStub("boards/fore.txt", 3, "stub", max_fps=10)
+    stub.out = io.StringIO()
+    stub.headless = True
+    keys = TimedKeys([(1.0, "6"), (1.01, "6"), (1.02, "6"), (1.5, "8")])
+    stub.keys = keys
+    monkeypatch.setattr(tui.time, "monotonic", keys.monotonic)
+
+    frames = []
+    render = stub.render
+
+    def record_render():
+        frames.append((keys.now, stub.curr_pos))
+        render()
+
+    stub.render = record_render
+    stub.render()
+    assert stub.frame_due_in() is None
+    stub.run_event_loop()
+
+    assert frames[:4] == [(0.0, Pos(0, 0)), (1.0, Pos(0, 1)),
+                          (pytest.approx(1.1), Pos(0, 3)), (1.5, Pos(1, 3))]
+    # and one more on the way out
+    assert len(frames) == 5
+    assert keys.timeouts == [None, None, pytest.approx(0.09),
+                             pytest.approx(0.08), None, None]
+
+
+# 56
+def test_profile_option(tmp_path):
+    """
+    Check that --profile, with a key script, dumps the profile,
+    summarizes the hot paths (render among them) and prints the
+    frame, cell and byte counters.
+    """
+    tui = import_tui()
+    from click.testing import CliRunner
+    script = tmp_path / "keys.txt"
+    script.write_text("# walk right, then mark a letter\n6 6 space\n")
+    dump = tmp_path / "prof.out"
+    result = CliRunner().invoke(tui.main, ["-g", "fore", "--script",
+                                           str(script), "--profile",
+                                           str(dump)])
+    assert result.exit_code == 0, result.output
+    assert dump.exists()
+    assert "(render)" in result.output
+    assert re.search(r"^\d+ frames, \d+ cells, \d+ bytes$", result.output,
+                     re.MULTILINE)